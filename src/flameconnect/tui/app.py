@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import sys
 from dataclasses import replace
@@ -263,6 +264,9 @@ class FlameConnectApp(App[None]):
         Args:
             fire: The selected Fire instance.
         """
+        current = self.screen
+        if isinstance(current, DashboardScreen) and current.fire_id == fire.fire_id:
+            return
         screen = DashboardScreen(client=self.client, fire=fire)
         self.push_screen(screen)
 
@@ -1075,8 +1079,13 @@ async def run_tui(*, verbose: bool = False) -> None:
                 rmcup = _curses.tigetstr("rmcup") or b""
                 cnorm = _curses.tigetstr("cnorm") or b""
                 clear = _curses.tigetstr("clear") or b""
-                sys.__stderr__.buffer.write(rmcup + cnorm + clear)
-                sys.__stderr__.flush()
+                # Write straight to the fd, bypassing the TextIOWrapper
+                # buffer.  os.write may accept only part of the data, so
+                # keep going until all of it has been written.
+                fd = sys.__stderr__.fileno()
+                pending = memoryview(rmcup + cnorm + clear)
+                while pending:
+                    pending = pending[os.write(fd, pending) :]
         except Exception:  # noqa: BLE001
             pass
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import webbrowser
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.containers import Vertical
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
 
+from flameconnect.b2c_login import b2c_login_with_credentials
 from flameconnect.exceptions import AuthenticationError
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +74,16 @@ class AuthScreen(ModalScreen[str | None]):
     browser-based auth with URL paste if credentials fail.
     """
 
+    __slots__ = (
+        "_auth_uri",
+        "_redirect_uri",
+        "_browser_fallback",
+        "_email_input",
+        "_password_input",
+        "_sign_in_btn",
+        "_inputs",
+    )
+
     CSS = _AUTH_CSS
 
     BINDINGS = [
@@ -102,11 +114,15 @@ class AuthScreen(ModalScreen[str | None]):
             yield Button("Sign In", variant="primary", id="sign-in-btn")
 
     def on_mount(self) -> None:
-        self.query_one("#email-input", Input).focus()
+        self._email_input = self.query_one("#email-input", Input)
+        self._password_input = self.query_one("#password-input", Input)
+        self._sign_in_btn = self.query_one("#sign-in-btn", Button)
+        self._inputs: tuple[Input, ...] = (self._email_input, self._password_input)
+        self._email_input.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "email-input" and not self._browser_fallback:
-            self.query_one("#password-input", Input).focus()
+            self._password_input.focus()
         elif event.input.id in ("password-input", "url-input"):
             self._on_submit()
 
@@ -121,10 +137,8 @@ class AuthScreen(ModalScreen[str | None]):
             self._submit_credentials()
 
     def _submit_credentials(self) -> None:
-        email_input = self.query_one("#email-input", Input)
-        password_input = self.query_one("#password-input", Input)
-        email = email_input.value.strip()
-        password = password_input.value
+        email = self._email_input.value.strip()
+        password = self._password_input.value
 
         if not email or not password:
             self._show_error("Email and password are required.")
@@ -140,8 +154,6 @@ class AuthScreen(ModalScreen[str | None]):
         )
 
     async def _do_credential_login(self, email: str, password: str) -> None:
-        from flameconnect.b2c_login import b2c_login_with_credentials
-
         try:
             redirect_url = await b2c_login_with_credentials(
                 self._auth_uri, email, password
@@ -154,21 +166,23 @@ class AuthScreen(ModalScreen[str | None]):
     def _switch_to_browser_fallback(self, error_msg: str) -> None:
         self._browser_fallback = True
 
-        # Hide credential inputs
-        self.query_one("#email-input", Input).display = False
-        self.query_one("#password-input", Input).display = False
-        for label in self.query(".auth-label"):
-            label.display = False
+        # Hide credential inputs and their labels
+        for widget in (
+            self._email_input,
+            self._password_input,
+            *self.query(".auth-label"),
+        ):
+            widget.display = False
 
         # Show error explaining why we fell back
         self._show_error(f"Direct login failed: {error_msg}")
 
         # Mount URL paste input
-        btn = self.query_one("#sign-in-btn", Button)
+        btn = self._sign_in_btn
         url_label = Label("Paste redirect URL", classes="auth-label browser-label")
         url_input = Input(placeholder="msal...://auth?code=...", id="url-input")
-        self.query_one("#auth-dialog", Vertical).mount(url_label, before=btn)
-        self.query_one("#auth-dialog", Vertical).mount(url_input, before=btn)
+        self.query_one("#auth-dialog", Vertical).mount(url_label, url_input, before=btn)
+        self._inputs = (url_input,)
 
         # Update button and status
         btn.label = "Submit URL"
@@ -178,11 +192,11 @@ class AuthScreen(ModalScreen[str | None]):
         self._hide_status()
         self._set_inputs_disabled(False)
 
-        # Open browser
-        webbrowser.open(self._auth_uri)
+        # Open browser off the event loop; launching it can block.
+        self.run_worker(partial(webbrowser.open, self._auth_uri), thread=True)
 
-        # Focus the new URL input after mount
-        self.set_timer(0.1, lambda: self.query_one("#url-input", Input).focus())
+        # Focus the new URL input once it has been mounted
+        self.call_after_refresh(url_input.focus)
 
     def _submit_url(self) -> None:
         url_input = self.query_one("#url-input", Input)
@@ -219,6 +233,6 @@ class AuthScreen(ModalScreen[str | None]):
         hint.display = True
 
     def _set_inputs_disabled(self, disabled: bool) -> None:
-        for inp in self.query(Input):
+        for inp in self._inputs:
             inp.disabled = disabled
-        self.query_one("#sign-in-btn", Button).disabled = disabled
+        self._sign_in_btn.disabled = disabled
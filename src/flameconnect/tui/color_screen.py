@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
 from textual.containers import Horizontal, Vertical
@@ -12,12 +13,14 @@ from flameconnect.models import NAMED_COLORS, RGBWColor
 from flameconnect.tui.widgets import ArrowNavMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
 
 _ButtonVariant = Literal["default", "primary", "success", "warning", "error"]
 
 # Preset layout: (key letter, display label, dark name, light name)
-_PRESET_COLS: list[tuple[str, str, str, str]] = [
+_PRESET_COLS: tuple[tuple[str, str, str, str], ...] = (
     ("R", "Red", "dark-red", "light-red"),
     ("Y", "Yellow", "dark-yellow", "light-yellow"),
     ("G", "Green", "dark-green", "light-green"),
@@ -25,7 +28,7 @@ _PRESET_COLS: list[tuple[str, str, str, str]] = [
     ("B", "Blue", "dark-blue", "light-blue"),
     ("P", "Purple", "dark-purple", "light-purple"),
     ("K", "Pink", "dark-pink", "light-pink"),
-]
+)
 
 _CSS = """
 ColorScreen {
@@ -61,24 +64,21 @@ ColorScreen {
 class ColorScreen(ArrowNavMixin, ModalScreen[RGBWColor | None]):
     """Modal screen for selecting an RGBW colour via presets or numeric input."""
 
+    __slots__ = ("_current", "_title", "_button_handlers")
+
     CSS = _CSS
 
+    # Lowercase selects the dark preset, uppercase the light one.
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
-        ("r", "select_preset('dark-red')", "Dark Red"),
-        ("R", "select_preset('light-red')", "Light Red"),
-        ("y", "select_preset('dark-yellow')", "Dark Yellow"),
-        ("Y", "select_preset('light-yellow')", "Light Yellow"),
-        ("g", "select_preset('dark-green')", "Dark Green"),
-        ("G", "select_preset('light-green')", "Light Green"),
-        ("c", "select_preset('dark-cyan')", "Dark Cyan"),
-        ("C", "select_preset('light-cyan')", "Light Cyan"),
-        ("b", "select_preset('dark-blue')", "Dark Blue"),
-        ("B", "select_preset('light-blue')", "Light Blue"),
-        ("p", "select_preset('dark-purple')", "Dark Purple"),
-        ("P", "select_preset('light-purple')", "Light Purple"),
-        ("k", "select_preset('dark-pink')", "Dark Pink"),
-        ("K", "select_preset('light-pink')", "Light Pink"),
+        *(
+            binding
+            for key, label, dark_name, light_name in _PRESET_COLS
+            for binding in (
+                (key.lower(), f"select_preset('{dark_name}')", f"Dark {label}"),
+                (key, f"select_preset('{light_name}')", f"Light {label}"),
+            )
+        ),
     ]
 
     def __init__(
@@ -90,6 +90,12 @@ class ColorScreen(ArrowNavMixin, ModalScreen[RGBWColor | None]):
         super().__init__(name=name)
         self._current = current
         self._title = title
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            f"preset-{preset}": partial(self.dismiss, NAMED_COLORS[preset])
+            for _key, _label, dark_name, light_name in _PRESET_COLS
+            for preset in (dark_name, light_name)
+        }
+        self._button_handlers["set-rgbw"] = self._apply_custom_rgbw
 
     def compose(self) -> ComposeResult:
         cur = self._current
@@ -143,12 +149,9 @@ class ColorScreen(ArrowNavMixin, ModalScreen[RGBWColor | None]):
                 yield Button("Set", id="set-rgbw", variant="primary")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
-        if button_id and button_id.startswith("preset-"):
-            preset_name = button_id.removeprefix("preset-")
-            self.dismiss(NAMED_COLORS[preset_name])
-        elif button_id == "set-rgbw":
-            self._apply_custom_rgbw()
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         self._apply_custom_rgbw()
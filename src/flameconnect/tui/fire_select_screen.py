@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.containers import Vertical
@@ -12,6 +13,8 @@ from flameconnect.models import Fire
 from flameconnect.tui.widgets import _display_name
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
     from textual.widgets._button import ButtonVariant
 
@@ -49,19 +52,13 @@ FireSelectScreen {
 class FireSelectScreen(ModalScreen[Fire | None]):
     """Modal screen for selecting a fireplace from the list."""
 
+    __slots__ = ("_fires", "_current_fire_id", "_button_specs", "_button_handlers")
+
     CSS = _CSS
 
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
-        ("1", "select_fire(1)", "Fire 1"),
-        ("2", "select_fire(2)", "Fire 2"),
-        ("3", "select_fire(3)", "Fire 3"),
-        ("4", "select_fire(4)", "Fire 4"),
-        ("5", "select_fire(5)", "Fire 5"),
-        ("6", "select_fire(6)", "Fire 6"),
-        ("7", "select_fire(7)", "Fire 7"),
-        ("8", "select_fire(8)", "Fire 8"),
-        ("9", "select_fire(9)", "Fire 9"),
+        *((str(i), f"select_fire({i})", f"Fire {i}") for i in range(1, 10)),
     ]
 
     def __init__(
@@ -73,34 +70,33 @@ class FireSelectScreen(ModalScreen[Fire | None]):
         super().__init__(name=name)
         self._fires = fires
         self._current_fire_id = current_fire_id
+        # (label, button id, variant) for each fire, built once up front.
+        self._button_specs: list[tuple[str, str, ButtonVariant]] = [
+            (
+                f"{idx + 1}. {fire.friendly_name}"
+                f" \u2014 {fire.brand} {fire.product_model}"
+                f" ({_display_name(fire.connection_state)})",
+                f"fire-{idx}",
+                "primary" if fire.fire_id == current_fire_id else "default",
+            )
+            for idx, fire in enumerate(fires)
+        ]
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            f"fire-{idx}": partial(self._select_by_index, idx)
+            for idx in range(len(fires))
+        }
 
     def compose(self) -> ComposeResult:
         with Vertical(id="fire-select-dialog"):
             yield Static("Switch Fireplace", id="fire-select-title")
             with Vertical(id="fire-select-list"):
-                for idx, fire in enumerate(self._fires):
-                    conn = _display_name(fire.connection_state)
-                    label = (
-                        f"{idx + 1}. {fire.friendly_name}"
-                        f" \u2014 {fire.brand} {fire.product_model}"
-                        f" ({conn})"
-                    )
-                    variant: ButtonVariant = (
-                        "primary"
-                        if fire.fire_id == self._current_fire_id
-                        else "default"
-                    )
-                    yield Button(
-                        label,
-                        id=f"fire-{idx}",
-                        variant=variant,
-                    )
+                for label, button_id, variant in self._button_specs:
+                    yield Button(label, id=button_id, variant=variant)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
-        if button_id and button_id.startswith("fire-"):
-            idx = int(button_id.removeprefix("fire-"))
-            self._select_by_index(idx)
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def _select_by_index(self, idx: int) -> None:
         if idx < 0 or idx >= len(self._fires):
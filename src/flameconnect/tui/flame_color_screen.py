@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
 from textual.containers import Horizontal, Vertical
@@ -12,6 +13,8 @@ from flameconnect.models import FlameColor
 from flameconnect.tui.widgets import ArrowNavMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
 
 _ButtonVariant = Literal["default", "primary", "success", "warning", "error"]
@@ -25,6 +28,9 @@ _COLOR_LABELS: dict[FlameColor, tuple[str, str]] = {
     FlameColor.YELLOW: ("Yellow", "e"),
     FlameColor.BLUE_RED: ("Blue/Red", "d"),
 }
+_COLOR_ITEMS: tuple[tuple[FlameColor, tuple[str, str]], ...] = tuple(
+    _COLOR_LABELS.items()
+)
 
 _CSS = """
 FlameColorScreen {
@@ -60,6 +66,8 @@ FlameColorScreen {
 class FlameColorScreen(ArrowNavMixin, ModalScreen[FlameColor | None]):
     """Modal screen for selecting flame color preset."""
 
+    __slots__ = ("_current_color", "_button_handlers")
+
     CSS = _CSS
 
     BINDINGS = [
@@ -76,6 +84,10 @@ class FlameColorScreen(ArrowNavMixin, ModalScreen[FlameColor | None]):
     def __init__(self, current_color: FlameColor, name: str | None = None) -> None:
         super().__init__(name=name)
         self._current_color = current_color
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            f"color-{color.name.lower()}": partial(self.dismiss, color)
+            for color in _COLOR_LABELS
+        }
 
     def compose(self) -> ComposeResult:
         current_label = _COLOR_LABELS[self._current_color][0]
@@ -85,7 +97,7 @@ class FlameColorScreen(ArrowNavMixin, ModalScreen[FlameColor | None]):
                 id="flame-color-title",
             )
             with Horizontal(id="flame-color-buttons"):
-                for color, (label, key) in _COLOR_LABELS.items():
+                for color, (label, key) in _COLOR_ITEMS:
                     variant: _ButtonVariant = (
                         "primary" if color == self._current_color else "default"
                     )
@@ -96,10 +108,9 @@ class FlameColorScreen(ArrowNavMixin, ModalScreen[FlameColor | None]):
                     )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
-        if button_id and button_id.startswith("color-"):
-            name = button_id.removeprefix("color-").upper()
-            self.dismiss(FlameColor[name])
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def action_select_color(self, color_name: str) -> None:
         self.dismiss(FlameColor[color_name])
@@ -48,15 +48,13 @@ FlameSpeedScreen {
 class FlameSpeedScreen(ArrowNavMixin, ModalScreen[int | None]):
     """Modal screen for selecting flame speed (1-5)."""
 
+    __slots__ = ("_current_speed",)
+
     CSS = _CSS
 
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
-        ("1", "select_speed(1)", "Speed 1"),
-        ("2", "select_speed(2)", "Speed 2"),
-        ("3", "select_speed(3)", "Speed 3"),
-        ("4", "select_speed(4)", "Speed 4"),
-        ("5", "select_speed(5)", "Speed 5"),
+        *((str(i), f"select_speed({i})", f"Speed {i}") for i in range(1, 6)),
     ]
 
     def __init__(self, current_speed: int, name: str | None = None) -> None:
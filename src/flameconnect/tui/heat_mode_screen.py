@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.containers import Horizontal, Vertical
@@ -12,9 +13,15 @@ from flameconnect.models import HeatMode
 from flameconnect.tui.widgets import ArrowNavMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
     from textual.widgets._button import ButtonVariant
 
+_HEAT_MODE_LABELS: dict[HeatMode, str] = {
+    mode: mode.name.replace("_", " ").title() for mode in HeatMode
+}
+
 _CSS = """
 HeatModeScreen {
     align: center middle;
@@ -82,17 +89,21 @@ class HeatModeScreen(ArrowNavMixin, ModalScreen[tuple[HeatMode, int | None] | No
         self._current_mode = current_mode
         self._current_boost = current_boost
         self._boost_input_visible = False
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "mode-normal": partial(self.dismiss, (HeatMode.NORMAL, None)),
+            "mode-eco": partial(self.dismiss, (HeatMode.ECO, None)),
+            "mode-boost": self._show_boost_input,
+        }
 
     def compose(self) -> ComposeResult:
         with Vertical(id="heat-mode-dialog"):
             yield Static(
-                f"Heat Mode (current:"
-                f" {self._current_mode.name.replace('_', ' ').title()})",
+                f"Heat Mode (current: {_HEAT_MODE_LABELS[self._current_mode]})",
                 id="heat-mode-title",
             )
             with Horizontal(id="heat-mode-buttons"):
                 for mode in (HeatMode.NORMAL, HeatMode.ECO, HeatMode.BOOST):
-                    label = mode.name.replace("_", " ").title()
+                    label = _HEAT_MODE_LABELS[mode]
                     variant: ButtonVariant = (
                         "primary" if mode == self._current_mode else "default"
                     )
@@ -117,24 +128,20 @@ class HeatModeScreen(ArrowNavMixin, ModalScreen[tuple[HeatMode, int | None] | No
         boost_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
-        if button_id == "mode-normal":
-            self.dismiss((HeatMode.NORMAL, None))
-        elif button_id == "mode-eco":
-            self.dismiss((HeatMode.ECO, None))
-        elif button_id == "mode-boost":
-            self._show_boost_input()
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "boost-duration":
             self._submit_boost(event.value)
 
     def _submit_boost(self, raw: str) -> None:
-        try:
-            minutes = int(raw)
-        except ValueError:
+        raw = raw.strip()
+        if not raw.isdecimal():
             self.notify("Please enter a number between 1 and 20", severity="error")
             return
+        minutes = int(raw)
         if not 1 <= minutes <= 20:
             self.notify("Duration must be between 1 and 20 minutes", severity="error")
             return
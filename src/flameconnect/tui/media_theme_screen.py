@@ -28,6 +28,17 @@ _THEME_LABELS: dict[MediaTheme, tuple[str, str]] = {
     MediaTheme.MIDNIGHT: ("Midnight", "m"),
 }
 
+# (theme, button label, button id), split into the two dialog rows.
+_THEME_BUTTONS: tuple[tuple[MediaTheme, str, str], ...] = tuple(
+    (theme, f"[{key.upper()}] {label}", f"theme-{theme.name.lower()}")
+    for theme, (label, key) in _THEME_LABELS.items()
+)
+_ROW1 = _THEME_BUTTONS[:5]
+_ROW2 = _THEME_BUTTONS[5:]
+_BUTTON_ID_TO_THEME: dict[str, MediaTheme] = {
+    button_id: theme for theme, _, button_id in _THEME_BUTTONS
+}
+
 _CSS = """
 MediaThemeScreen {
     align: center middle;
@@ -86,34 +97,22 @@ class MediaThemeScreen(ArrowNavMixin, ModalScreen[MediaTheme | None]):
 
     def compose(self) -> ComposeResult:
         current_label = _THEME_LABELS[self._current_theme][0]
-        themes = list(_THEME_LABELS.items())
-        row1 = themes[:5]
-        row2 = themes[5:]
         with Vertical(id="media-theme-dialog"):
             yield Static(
                 f"Media Theme (current: {current_label})",
                 id="media-theme-title",
             )
             with Horizontal(id="media-theme-row1"):
-                for theme, (label, key) in row1:
-                    yield Button(
-                        f"[{key.upper()}] {label}",
-                        id=f"theme-{theme.name.lower()}",
-                        variant=self._variant_for(theme),
-                    )
+                for theme, label, button_id in _ROW1:
+                    yield Button(label, id=button_id, variant=self._variant_for(theme))
             with Horizontal(id="media-theme-row2"):
-                for theme, (label, key) in row2:
-                    yield Button(
-                        f"[{key.upper()}] {label}",
-                        id=f"theme-{theme.name.lower()}",
-                        variant=self._variant_for(theme),
-                    )
+                for theme, label, button_id in _ROW2:
+                    yield Button(label, id=button_id, variant=self._variant_for(theme))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
-        if button_id and button_id.startswith("theme-"):
-            name = button_id.removeprefix("theme-").upper()
-            self.dismiss(MediaTheme[name])
+        theme = _BUTTON_ID_TO_THEME.get(event.button.id or "")
+        if theme is not None:
+            self.dismiss(theme)
 
     def action_select_theme(self, theme_name: str) -> None:
         self.dismiss(MediaTheme[theme_name])
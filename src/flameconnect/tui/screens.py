@@ -2,26 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING
+import os
+import time
+from functools import cache, lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, cast
 
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Footer, Header, RichLog, Static
 
+from flameconnect.models import FlameEffectParam, HeatParam, ModeParam
 from flameconnect.tui.widgets import (
     FireplaceVisual,
     ParameterPanel,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
     from textual import events
     from textual.app import ComposeResult
 
     from flameconnect.client import FlameConnectClient
-    from flameconnect.models import Fire, FireOverview, ModeParam, Parameter
+    from flameconnect.models import Fire, FireOverview, Parameter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -100,6 +108,47 @@ _COMPACT_THRESHOLD_WIDTH = 100
 _COMPACT_THRESHOLD_HEIGHT = 30
 
 
+@lru_cache(maxsize=1)
+def _clock(seconds: int) -> str:
+    """Format an epoch second as local ``HH:MM:SS``.
+
+    Log bursts share the same second, so the last result is cached.
+    """
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
+
+
+@cache
+def _fields_and_labels(param_type: type) -> tuple[tuple[str, str], ...]:
+    """Return ``(field name, display label)`` pairs for a parameter type."""
+    return tuple(
+        (f.name, f.name.replace("_", " ").title())
+        for f in dataclasses.fields(param_type)
+    )
+
+
+@cache
+def _field_values(param_type: type) -> Callable[[object], tuple[object, ...]]:
+    """Return a getter yielding all field values of a parameter as a tuple."""
+    names = [name for name, _ in _fields_and_labels(param_type)]
+    if len(names) > 1:
+        getter: Callable[[object], tuple[object, ...]] = attrgetter(*names)
+        return getter
+    # attrgetter with one name returns a bare value rather than a tuple.
+    return lambda obj: tuple(getattr(obj, name) for name in names)
+
+
+@cache
+def _type_pretty_name(param_type: type) -> str:
+    """Return the parameter type name without its ``Param`` suffix."""
+    return param_type.__name__.removesuffix("Param")
+
+
+def _format_log_line(ts: str, level: int, msg: str) -> str:
+    """Return the messages-panel markup for one timestamped log line."""
+    open_tag, close_tag = _LEVEL_MARKUP.get(level, ("", ""))
+    return f"[dim]{ts}[/dim] {open_tag}{msg}{close_tag}"
+
+
 class _TuiLogHandler(logging.Handler):
     """Logging handler that writes records into a Textual RichLog widget."""
 
@@ -109,13 +158,10 @@ class _TuiLogHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            ts = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-            msg = self.format(record)
-            open_tag, close_tag = _LEVEL_MARKUP.get(record.levelno, ("", ""))
-            self._rich_log.write(
-                f"[dim]{ts}[/dim] {open_tag}{msg}{close_tag}",
-                shrink=False,
+            line = _format_log_line(
+                _clock(int(record.created)), record.levelno, self.format(record)
             )
+            self._rich_log.write(line, shrink=False)
         except Exception:  # noqa: BLE001
             self.handleError(record)
 
@@ -143,28 +189,35 @@ class DashboardScreen(Screen[None]):
         self._current_mode: ModeParam | None = None
         self._previous_params: dict[type, Parameter] = {}
         self._log_handler: _TuiLogHandler | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refreshes_started = 0
         parts = [f"{fire.friendly_name} ({fire.fire_id})"]
         brand_model = f"{fire.brand} {fire.product_model}".strip()
         if brand_model:
             parts.append(brand_model)
-        self.sub_title = " | ".join(parts)
+        # Name and model never change; only the refresh time is appended.
+        self._sub_title_prefix = " | ".join(parts)
+        self.sub_title = self._sub_title_prefix
+        # Created up front so refreshes and log calls never look them up.
+        self._param_panel = ParameterPanel(id="param-panel")
+        self._visual = FireplaceVisual(id="fireplace-visual")
+        self._rich_log = RichLog(id="messages-panel", markup=True, wrap=True)
 
     def compose(self) -> ComposeResult:
         """Compose the dashboard layout."""
         yield Header()
         with Vertical(id="dashboard-container"):
             with Container(id="status-section"):
-                yield FireplaceVisual(id="fireplace-visual")
+                yield self._visual
                 with VerticalScroll(id="param-scroll"):
-                    yield ParameterPanel(id="param-panel")
+                    yield self._param_panel
             yield Static("[bold]Messages[/bold]", id="messages-label")
-            yield RichLog(id="messages-panel", markup=True, wrap=True)
+            yield self._rich_log
         yield Footer()
 
     def on_mount(self) -> None:
-        """Install log handler and do initial data load."""
-        rich_log = self.query_one("#messages-panel", RichLog)
-        self._log_handler = _TuiLogHandler(rich_log)
+        """Install the log handler and do the initial load."""
+        self._log_handler = _TuiLogHandler(self._rich_log)
         fmt = "%(levelname)s %(name)s: %(message)s"
         self._log_handler.setFormatter(logging.Formatter(fmt))
         fc_logger = logging.getLogger("flameconnect")
@@ -175,8 +228,6 @@ class DashboardScreen(Screen[None]):
 
     def _apply_compact_mode(self) -> None:
         """Apply or remove compact layout class based on current size."""
-        import os
-
         try:
             term = os.get_terminal_size()
             w, h = term.columns, term.lines
@@ -189,7 +240,8 @@ class DashboardScreen(Screen[None]):
         # Toggle .compact class on each widget — same-element CSS
         # selectors (#id.compact) work reliably in Textual, unlike
         # descendant selectors from the Screen's class.
-        self.query_one("#fireplace-visual").display = not compact
+        self._visual.display = not compact
+        self._sync_animation()
         for widget_id in (
             "#dashboard-container",
             "#status-section",
@@ -199,6 +251,25 @@ class DashboardScreen(Screen[None]):
         ):
             self.query_one(widget_id).set_class(compact, "compact")
 
+    def _sync_animation(self) -> None:
+        """Run the flame animation only while the visual can be seen."""
+        if self.is_current and self._visual.display:
+            self._visual.resume_animation()
+        else:
+            self._visual.pause_animation()
+
+    def on_screen_suspend(self) -> None:
+        """Pause the flames if the dashboard is no longer visible.
+
+        Modal screens leave the dashboard showing behind them, so the
+        flames keep running unless the dashboard is really hidden.
+        """
+        self._sync_animation()
+
+    def on_screen_resume(self) -> None:
+        """Restore the flames once the dashboard is visible again."""
+        self._sync_animation()
+
     def on_resize(self, event: events.Resize) -> None:
         """Toggle compact layout based on terminal dimensions."""
         self._apply_compact_mode()
@@ -217,23 +288,45 @@ class DashboardScreen(Screen[None]):
             msg: The message text (may contain Rich markup).
             level: A :mod:`logging` level constant (DEBUG, INFO, WARNING, ERROR).
         """
-        ts = datetime.now().strftime("%H:%M:%S")
-        open_tag, close_tag = _LEVEL_MARKUP.get(level, ("", ""))
-        rich_log = self.query_one("#messages-panel", RichLog)
-        rich_log.write(f"[dim]{ts}[/dim] {open_tag}{msg}{close_tag}", shrink=False)
+        self._write_log_lines((msg,), level)
+
+    def _write_log_lines(
+        self, messages: Iterable[str], level: int = logging.INFO
+    ) -> None:
+        """Write several messages to the messages panel in one RichLog write.
+
+        Each message becomes its own line with the shared timestamp and
+        level markup, so a batch costs a single layout and repaint.
+        """
+        ts = _clock(int(time.time()))
+        self._rich_log.write(
+            "\n".join(_format_log_line(ts, level, msg) for msg in messages),
+            shrink=False,
+        )
 
     async def _initial_load(self) -> None:
         """Perform the initial data load."""
         await self.refresh_state()
 
     async def refresh_state(self) -> None:
-        """Fetch the latest fireplace state and update the display."""
-        try:
-            overview = await self.client.get_fire_overview(self.fire_id)
-            self._update_display(overview)
-        except Exception as exc:
-            _LOGGER.exception("Failed to refresh fireplace state")
-            self.notify(str(exc), severity="error", timeout=5)
+        """Fetch the latest fireplace state and update the display.
+
+        Concurrent calls are coalesced: callers that arrive while a fetch
+        is running wait for it and then share a single follow-up fetch,
+        so each caller still sees state read after it asked.
+        """
+        requested_at = self._refreshes_started
+        async with self._refresh_lock:
+            if self._refreshes_started > requested_at:
+                # Another waiter already fetched after this call was made.
+                return
+            self._refreshes_started += 1
+            try:
+                overview = await self.client.get_fire_overview(self.fire_id)
+                self._update_display(overview)
+            except Exception as exc:
+                _LOGGER.exception("Failed to refresh fireplace state")
+                self.notify(str(exc), severity="error", timeout=5)
 
     def _update_display(self, overview: FireOverview) -> None:
         """Update all widgets with fresh data from the API.
@@ -241,41 +334,38 @@ class DashboardScreen(Screen[None]):
         Args:
             overview: The latest FireOverview from the API.
         """
-        from flameconnect.models import FlameEffectParam, HeatParam, ModeParam
-
-        param_panel = self.query_one("#param-panel", ParameterPanel)
-        param_panel.update_parameters(overview.parameters)
-
-        # Log changed attributes
         current_params: dict[type, Parameter] = {
             type(p): p for p in overview.parameters
         }
+        # Always handed to the panel: it skips unchanged parameters itself
+        # but keeps the clock-relative timer row current.
+        self._param_panel.update_parameters(overview.parameters)
+        if self._previous_params and current_params == self._previous_params:
+            # Nothing changed since the last refresh; only bump the timestamp.
+            self._update_sub_title()
+            return
+
+        # Log changed attributes
         if self._previous_params:
             self._log_param_changes(self._previous_params, current_params)
         self._previous_params = current_params
 
         # Track the current mode, flame effect and heat for visual
-        mode_param: ModeParam | None = None
-        flame_effect_param: FlameEffectParam | None = None
-        heat_param: HeatParam | None = None
-        for param in overview.parameters:
-            if isinstance(param, ModeParam):
-                mode_param = param
-            elif isinstance(param, FlameEffectParam):
-                flame_effect_param = param
-            elif isinstance(param, HeatParam):
-                heat_param = param
+        mode_param = cast("ModeParam | None", current_params.get(ModeParam))
+        flame_effect_param = cast(
+            "FlameEffectParam | None", current_params.get(FlameEffectParam)
+        )
+        heat_param = cast("HeatParam | None", current_params.get(HeatParam))
         self._current_mode = mode_param
 
-        visual = self.query_one("#fireplace-visual", FireplaceVisual)
-        visual.update_state(mode_param, flame_effect_param, heat_param)
+        self._visual.update_state(mode_param, flame_effect_param, heat_param)
+        self._update_sub_title()
 
-        parts: list[str] = [f"{self._fire.friendly_name} ({overview.fire.fire_id})"]
-        brand_model = f"{self._fire.brand} {self._fire.product_model}".strip()
-        if brand_model:
-            parts.append(brand_model)
-        parts.append(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
-        self.sub_title = " | ".join(parts)
+    def _update_sub_title(self) -> None:
+        """Show the fire name, model and last refresh time in the header."""
+        self.sub_title = (
+            f"{self._sub_title_prefix} | Updated: {_clock(int(time.time()))}"
+        )
 
     def _log_param_changes(
         self,
@@ -283,24 +373,34 @@ class DashboardScreen(Screen[None]):
         new: dict[type, Parameter],
     ) -> None:
         """Compare old and new parameters, logging any changed fields."""
+        if self._log_handler is None:
+            # The messages panel is unmounted; there is nowhere to log to.
+            return
+        # Bound once; both are called inside the loop.
+        old_get = old.get
+        lines: list[str] = []
+        append = lines.append
         for param_type, new_param in new.items():
-            old_param = old.get(param_type)
+            old_param = old_get(param_type)
             if old_param is None or old_param == new_param:
                 continue
-            name = param_type.__name__.removesuffix("Param")
-            for field in dataclasses.fields(new_param):
-                old_val = getattr(old_param, field.name)
-                new_val = getattr(new_param, field.name)
+            name = _type_pretty_name(param_type)
+            values = _field_values(param_type)
+            for (_, label), old_val, new_val in zip(
+                _fields_and_labels(param_type),
+                values(old_param),
+                values(new_param),
+                strict=True,
+            ):
                 if old_val != new_val:
-                    label = field.name.replace("_", " ").title()
-                    self.log_message(
-                        f"[bold]{name}[/bold] {label}: {old_val} → {new_val}"
-                    )
+                    append(f"[bold]{name}[/bold] {label}: {old_val} → {new_val}")
+        if lines:
+            self._write_log_lines(lines)
 
     @property
-    def current_parameters(self) -> dict[type, Parameter]:
-        """Return the current cached parameters."""
-        return dict(self._previous_params)
+    def current_parameters(self) -> Mapping[type, Parameter]:
+        """Return a read-only view of the current cached parameters."""
+        return MappingProxyType(self._previous_params)
 
     @property
     def current_mode(self) -> ModeParam | None:
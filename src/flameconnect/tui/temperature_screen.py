@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 from textual.containers import Horizontal, Vertical
@@ -14,6 +15,9 @@ from flameconnect.tui.widgets import ArrowNavMixin
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+# Plain decimal number, optionally signed (no exponent, inf or nan).
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
 
 def _convert_temp(celsius: float, unit: TempUnit) -> float:
     """Convert a Celsius temperature for display.
@@ -121,11 +125,11 @@ class TemperatureScreen(ArrowNavMixin, ModalScreen[float | None]):
     def _validate_and_dismiss(self) -> None:
         """Validate input and dismiss with the temperature value."""
         input_widget = self.query_one("#temp-input", Input)
-        try:
-            temp = float(input_widget.value)
-        except ValueError:
+        raw = input_widget.value.strip()
+        if _NUMBER_RE.fullmatch(raw) is None:
             self.notify("Please enter a valid number", severity="error")
             return
+        temp = float(raw)
         if self._unit == TempUnit.CELSIUS:
             min_t, max_t = 5.0, 35.0
         else:
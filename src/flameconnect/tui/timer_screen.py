@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 from textual.containers import Horizontal, Vertical
@@ -13,6 +14,10 @@ from flameconnect.tui.widgets import ArrowNavMixin
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+# Whole number of minutes, optionally signed so that out-of-range
+# negatives get the range message rather than a parse error.
+_INTEGER_RE = re.compile(r"[+-]?\d+")
+
 _CSS = """
 TimerScreen {
     align: center middle;
@@ -92,11 +97,11 @@ class TimerScreen(ArrowNavMixin, ModalScreen[int | None]):
     def _validate_and_dismiss(self) -> None:
         """Validate input and dismiss with the duration value."""
         input_widget = self.query_one("#timer-input", Input)
-        try:
-            duration = int(input_widget.value)
-        except ValueError:
+        raw = input_widget.value.strip()
+        if _INTEGER_RE.fullmatch(raw) is None:
             self.notify("Please enter a valid number", severity="error")
             return
+        duration = int(raw)
         if not (1 <= duration <= 480):
             self.notify(
                 "Duration must be between 1 and 480 minutes",
@@ -2,41 +2,51 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
+from rich.text import Span as _Span
 from rich.text import Text as _Text
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
 from flameconnect.models import (
+    Brightness,
+    ConnectionState,
+    ErrorParam,
     FireMode,
     FlameColor,
     FlameEffect,
+    FlameEffectParam,
+    HeatControl,
+    HeatMode,
+    HeatModeParam,
+    HeatParam,
+    HeatStatus,
     LightStatus,
+    LogEffect,
+    LogEffectParam,
+    MediaTheme,
+    ModeParam,
+    PulsatingEffect,
+    SoftwareVersionParam,
+    SoundParam,
     TempUnit,
+    TempUnitParam,
+    TimerParam,
+    TimerStatus,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from enum import IntEnum
 
     from textual.app import ComposeResult
     from textual.timer import Timer
 
-    from flameconnect.models import (
-        ConnectionState,
-        ErrorParam,
-        FlameEffectParam,
-        HeatModeParam,
-        HeatParam,
-        LogEffectParam,
-        ModeParam,
-        Parameter,
-        RGBWColor,
-        SoftwareVersionParam,
-        SoundParam,
-        TempUnitParam,
-        TimerParam,
-    )
+    from flameconnect.models import Parameter, RGBWColor
 
 
 class ArrowNavMixin:
@@ -105,10 +115,44 @@ class ClickableParam(Horizontal):
         yield Static(self._label, classes="param-label")
         yield _ClickableValue(self._value, action=self._action)
 
+    def set_value(self, value: str) -> None:
+        """Replace the displayed value, keeping the label and action."""
+        self._value = value
+        # Before compose has run there is nothing to update; compose will
+        # pick up the new value.
+        for child in self.query(_ClickableValue):
+            child.update(value)
+
+
+# Display strings for every model enum member, keyed by member name.
+# Keying by name rather than by member matters: IntEnum members of
+# different enums with the same value compare and hash equal.
+_DISPLAY_NAMES: dict[str, str] = {
+    member.name: member.name.replace("_", " ").title()
+    for enum_type in (
+        Brightness,
+        ConnectionState,
+        FireMode,
+        FlameColor,
+        FlameEffect,
+        HeatControl,
+        HeatMode,
+        HeatStatus,
+        LightStatus,
+        LogEffect,
+        MediaTheme,
+        PulsatingEffect,
+        TempUnit,
+        TimerStatus,
+    )
+    for member in enum_type
+}
+
 
 def _display_name(value: IntEnum) -> str:
     """Convert an enum member name to Title Case for display."""
-    return value.name.replace("_", " ").title()
+    name = value.name
+    return _DISPLAY_NAMES.get(name) or name.replace("_", " ").title()
 
 
 def _format_rgbw(color: RGBWColor) -> str:
@@ -122,11 +166,17 @@ _MODE_DISPLAY: dict[FireMode, str] = {
 }
 
 
+_TEMP_SUFFIXES: dict[TempUnit, str] = {
+    TempUnit.CELSIUS: "C",
+    TempUnit.FAHRENHEIT: "F",
+}
+
+
 def _temp_suffix(temp_unit: TempUnitParam | None) -> str:
     """Return the temperature unit suffix (e.g. 'C' or 'F'), or empty."""
     if temp_unit is None:
         return ""
-    return "C" if temp_unit.unit == TempUnit.CELSIUS else "F"
+    return _TEMP_SUFFIXES[temp_unit.unit]
 
 
 def _convert_temp(celsius: float, unit: TempUnit) -> float:
@@ -148,7 +198,7 @@ def _format_mode(
 
     Returns a list of (label, value, action) tuples.
     """
-    mode_label = _MODE_DISPLAY.get(param.mode, _display_name(param.mode))
+    mode_label = _MODE_DISPLAY.get(param.mode) or _display_name(param.mode)
     suffix = _temp_suffix(temp_unit)
     unit = temp_unit.unit if temp_unit else TempUnit.CELSIUS
     display_temp = _convert_temp(param.target_temperature, unit)
@@ -240,8 +290,6 @@ def _format_heat(
 
     Returns a list of (label, value, action) tuples.
     """
-    from flameconnect.models import HeatMode
-
     boost_value = (
         f"{param.boost_duration}min" if param.heat_mode == HeatMode.BOOST else "Off"
     )
@@ -291,14 +339,10 @@ def _format_timer(
 
     Returns a list of (label, value, action) tuples.
     """
-    from datetime import datetime, timedelta
-
-    from flameconnect.models import TimerStatus
-
     value = f"{_display_name(param.timer_status)}  Duration: {param.duration}min"
     if param.timer_status == TimerStatus.ENABLED and param.duration > 0:
-        off_time = datetime.now() + timedelta(minutes=param.duration)
-        value += f"  Off at {off_time.strftime('%H:%M')}"
+        off_time = time.localtime(time.time() + param.duration * 60)
+        value += f"  Off at {off_time.tm_hour:02d}:{off_time.tm_min:02d}"
     return [("[bold]Timer:[/bold] ", value, "toggle_timer")]
 
 
@@ -324,6 +368,9 @@ def _format_software_version(
     ]
 
 
+_ERROR_BYTES_FORMAT = "0x%02X 0x%02X 0x%02X 0x%02X"
+
+
 def _format_error(
     param: ErrorParam,
 ) -> list[tuple[str, str, str | None]]:
@@ -331,23 +378,15 @@ def _format_error(
 
     Returns a list of (label, value, action) tuples.
     """
-    has_error = any(
-        b != 0
-        for b in (
-            param.error_byte1,
-            param.error_byte2,
-            param.error_byte3,
-            param.error_byte4,
-        )
-    )
-    if has_error:
+    b1 = param.error_byte1
+    b2 = param.error_byte2
+    b3 = param.error_byte3
+    b4 = param.error_byte4
+    if b1 | b2 | b3 | b4:
         return [
             (
                 "[bold red]Error:[/bold red] ",
-                f"0x{param.error_byte1:02X} "
-                f"0x{param.error_byte2:02X} "
-                f"0x{param.error_byte3:02X} "
-                f"0x{param.error_byte4:02X}",
+                _ERROR_BYTES_FORMAT % (b1, b2, b3, b4),
                 None,
             ),
         ]
@@ -410,6 +449,58 @@ def _format_log_effect(
     ]
 
 
+# Formatters keyed by exact parameter type.  Mode and heat also need the
+# temperature unit, so they live in their own table.
+_FORMATTERS: dict[type, Callable[[Any], list[tuple[str, str, str | None]]]] = {
+    HeatModeParam: _format_heat_mode,
+    FlameEffectParam: _format_flame_effect,
+    TimerParam: _format_timer,
+    SoftwareVersionParam: _format_software_version,
+    ErrorParam: _format_error,
+    TempUnitParam: _format_temp_unit,
+    SoundParam: _format_sound,
+    LogEffectParam: _format_log_effect,
+}
+_UNIT_FORMATTERS: dict[
+    type,
+    Callable[[Any, TempUnitParam | None], list[tuple[str, str, str | None]]],
+] = {
+    ModeParam: _format_mode,
+    HeatParam: _format_heat,
+}
+
+# Desired display order (ErrorParam last).
+_DISPLAY_ORDER: tuple[type, ...] = (
+    ModeParam,
+    HeatParam,
+    HeatModeParam,
+    FlameEffectParam,
+    TimerParam,
+    SoftwareVersionParam,
+    TempUnitParam,
+    SoundParam,
+    LogEffectParam,
+    ErrorParam,
+)
+
+
+@lru_cache(maxsize=64)
+def _param_rows(
+    param: Parameter,
+    temp_unit: TempUnitParam | None,
+) -> tuple[tuple[str, str, str | None], ...]:
+    """Format one parameter, memoised on the (frozen) parameter value.
+
+    The device reports mostly unchanged parameters on every poll, so
+    repeat refreshes reuse the formatted rows.  *temp_unit* should be
+    ``None`` for parameters whose formatter does not take it.
+    """
+    formatter = _FORMATTERS.get(type(param))
+    if formatter is not None:
+        return tuple(formatter(param))
+    return tuple(_UNIT_FORMATTERS[type(param)](param, temp_unit))
+
+
 def format_parameters(
     params: list[Parameter],
 ) -> list[tuple[str, str, str | None]]:
@@ -421,67 +512,23 @@ def format_parameters(
     Returns:
         A list of (label, value, action_name | None) tuples.
     """
-    from flameconnect.models import (
-        ErrorParam,
-        FlameEffectParam,
-        HeatModeParam,
-        HeatParam,
-        LogEffectParam,
-        ModeParam,
-        SoftwareVersionParam,
-        SoundParam,
-        TempUnitParam,
-        TimerParam,
-    )
+    # Index by exact type (the parameter dataclasses are never subclassed),
+    # then walk the display order once.
+    by_type: dict[type, Parameter] = {type(param): param for param in params}
+    temp_unit = cast("TempUnitParam | None", by_type.get(TempUnitParam))
 
-    # Extract the temperature unit (if present) for use in formatters.
-    temp_unit: TempUnitParam | None = None
-    for param in params:
-        if isinstance(param, TempUnitParam):
-            temp_unit = param
-            break
-
-    # Collect formatted tuples keyed by type.
-    formatted: dict[type, list[tuple[str, str, str | None]]] = {}
-    for param in params:
-        if isinstance(param, ModeParam):
-            formatted[ModeParam] = _format_mode(param, temp_unit)
-        elif isinstance(param, HeatParam):
-            formatted[HeatParam] = _format_heat(param, temp_unit)
-        elif isinstance(param, HeatModeParam):
-            formatted[HeatModeParam] = _format_heat_mode(param)
-        elif isinstance(param, FlameEffectParam):
-            formatted[FlameEffectParam] = _format_flame_effect(param)
-        elif isinstance(param, TimerParam):
-            formatted[TimerParam] = _format_timer(param)
-        elif isinstance(param, SoftwareVersionParam):
-            formatted[SoftwareVersionParam] = _format_software_version(param)
-        elif isinstance(param, ErrorParam):
-            formatted[ErrorParam] = _format_error(param)
-        elif isinstance(param, TempUnitParam):
-            formatted[TempUnitParam] = _format_temp_unit(param)
-        elif isinstance(param, SoundParam):
-            formatted[SoundParam] = _format_sound(param)
-        elif isinstance(param, LogEffectParam):
-            formatted[LogEffectParam] = _format_log_effect(param)
-
-    # Desired display order (ErrorParam last).
-    display_order: list[type] = [
-        ModeParam,
-        HeatParam,
-        HeatModeParam,
-        FlameEffectParam,
-        TimerParam,
-        SoftwareVersionParam,
-        TempUnitParam,
-        SoundParam,
-        LogEffectParam,
-        ErrorParam,
-    ]
     result: list[tuple[str, str, str | None]] = []
-    for t in display_order:
-        if t in formatted:
-            result.extend(formatted[t])
+    for t in _DISPLAY_ORDER:
+        param = by_type.get(t)
+        if param is None:
+            continue
+        if type(param) is TimerParam:
+            # The "Off at" time depends on the clock, not just the value.
+            result.extend(_format_timer(param))
+        elif t in _UNIT_FORMATTERS:
+            result.extend(_param_rows(param, temp_unit))
+        else:
+            result.extend(_param_rows(param, None))
 
     if not result:
         result.append(("[dim]No parameters available[/dim]", "", None))
@@ -489,19 +536,19 @@ def format_parameters(
     return result
 
 
+_CONNECTION_STATE_COLORS: dict[ConnectionState, str] = {
+    ConnectionState.CONNECTED: "green",
+    ConnectionState.NOT_CONNECTED: "red",
+    ConnectionState.UPDATING_FIRMWARE: "yellow",
+    ConnectionState.UNKNOWN: "dim",
+}
+
+
 def _format_connection_state(
     state: ConnectionState,
 ) -> str:
     """Format connection state with color markup."""
-    from flameconnect.models import ConnectionState as CS
-
-    color_map: dict[CS, str] = {
-        CS.CONNECTED: "green",
-        CS.NOT_CONNECTED: "red",
-        CS.UPDATING_FIRMWARE: "yellow",
-        CS.UNKNOWN: "dim",
-    }
-    color = color_map.get(state, "dim")
+    color = _CONNECTION_STATE_COLORS.get(state, "dim")
     label = _display_name(state)
     return f"[{color}]{label}[/{color}]"
 
@@ -525,12 +572,18 @@ _MIN_FLAME_ROWS = 2
 _DEFAULT_HEIGHT = 20
 
 
+@lru_cache(maxsize=256)
+def _rgbw_style_cached(red: int, green: int, blue: int, white: int) -> str:
+    """Return the ``rgb(r,g,b)`` style for RGBW channel values."""
+    r = min(red + white, 255)
+    g = min(green + white, 255)
+    b = min(blue + white, 255)
+    return f"rgb({r},{g},{b})"
+
+
 def _rgbw_to_style(color: RGBWColor) -> str:
     """Convert an RGBW color to a Rich ``rgb(r,g,b)`` style string."""
-    r = min(color.red + color.white, 255)
-    g = min(color.green + color.white, 255)
-    b = min(color.blue + color.white, 255)
-    return f"rgb({r},{g},{b})"
+    return _rgbw_style_cached(color.red, color.green, color.blue, color.white)
 
 
 # Flame color palettes: (tip, mid, base) Rich style strings
@@ -557,6 +610,11 @@ _FLAME_SPEED_INTERVALS: dict[int, float] = {
 # Number of heat indicator rows rendered above the flames
 _HEAT_ROWS = 2
 
+# Rendered frames kept per FireplaceVisual.  The animation cycles three
+# palette rotations, so a handful of entries covers steady state plus a
+# few recent sizes or colours.
+_ART_CACHE_SIZE = 16
+
 # Flame row definitions: (body_width_fraction, zone_index, atoms)
 # zone_index: 0=tip, 1=mid, 2=base (indexes into palette tuple)
 # atoms: (text, trailing_gap_weight)
@@ -674,6 +732,25 @@ _FLAME_DEFS: list[tuple[float, int, list[tuple[str, int]]]] = [
 ]
 
 
+# _FLAME_DEFS with each row's fixed geometry precomputed:
+# (body_width_fraction, zone_index, atoms, chars_w, total_weight, min_w)
+# chars_w: total atom text width; total_weight: sum of gap weights
+# (at least 1); min_w: narrowest body that keeps one space between atoms.
+_FLAME_ROWS: tuple[
+    tuple[float, int, tuple[tuple[str, int], ...], int, int, int], ...
+] = tuple(
+    (
+        frac,
+        zone,
+        tuple(atoms),
+        sum(len(text) for text, _ in atoms),
+        sum(gap for _, gap in atoms) or 1,
+        sum(len(text) for text, _ in atoms) + len(atoms) - 1,
+    )
+    for frac, zone, atoms in _FLAME_DEFS
+)
+
+
 def _rotate_palette(
     palette: tuple[str, str, str],
     frame: int,
@@ -692,27 +769,49 @@ def _rotate_palette(
     return (palette[2], palette[0], palette[1])
 
 
-def _expand_flame(
-    atoms: list[tuple[str, int]],
-    body_width: int,
-    style: str,
-) -> _Text:
-    """Build a single flame row, distributing gaps proportionally."""
-    chars_w = sum(len(a[0]) for a in atoms)
+@lru_cache(maxsize=128)
+def _expand_flame(row: int, body_width: int) -> tuple[tuple[str, bool], ...]:
+    """Lay out flame row *row* of :data:`_FLAME_ROWS`, distributing gaps.
+
+    Returns ``(text, is_flame)`` pieces; flame pieces take the row style
+    and gap pieces are unstyled.
+
+    The layout depends only on the row and the body width, so it is cached
+    and recomputed only when the widget is resized.  The cache is keyed by
+    row index so a lookup hashes two ints rather than the atom tuples.
+    """
+    _, _, atoms, chars_w, total_weight, _ = _FLAME_ROWS[row]
     total_gap = max(body_width - chars_w, 0)
-    total_weight = sum(a[1] for a in atoms) or 1
 
-    line = _Text()
+    pieces: list[tuple[str, bool]] = []
     remaining_gap = total_gap
     remaining_weight = total_weight
     for text, gap_w in atoms:
-        line.append(text, style=style)
+        pieces.append((text, True))
         if gap_w > 0 and remaining_weight > 0:
             sp = remaining_gap * gap_w // remaining_weight
             remaining_gap -= sp
             remaining_weight -= gap_w
-            line.append(" " * sp)
-    return line
+            pieces.append((" " * sp, False))
+    return tuple(pieces)
+
+
+@lru_cache(maxsize=128)
+def _flame_row_layout(row: int, inner_width: int) -> tuple[tuple[str, bool], ...]:
+    """Lay out flame row *row* centred in an *inner_width* wide interior.
+
+    Like :func:`_expand_flame`, with the leading and trailing padding
+    included, so a frame only walks the cached pieces for each row.
+    """
+    body_frac, _, _, _, _, min_w = _FLAME_ROWS[row]
+    body_w = max(int(inner_width * body_frac), min_w)
+    lead = (inner_width - body_w) // 2
+    trail = max(inner_width - lead - body_w, 0)
+    return (
+        (" " * lead, False),
+        *_expand_flame(row, body_w),
+        (" " * trail, False),
+    )
 
 
 def _build_fire_art(
@@ -744,10 +843,40 @@ def _build_fire_art(
     # Rotate palette for animation
     palette = _rotate_palette(flame_palette, anim_frame)
 
-    result = _Text()
-
-    def _nl() -> None:
-        result.append("\n")
+    # Fills repeated on several rows are built once per frame.
+    blank_fill = " " * iw
+    outer_rule = "\u2500" * ow
+    inner_rule = "\u2500" * (ow - 2)
+
+    # The art is collected as plain-text pieces plus style spans and
+    # turned into a single Text at the end, instead of growing a Text
+    # one append (and one Span object merge) at a time.
+    parts: list[str] = []
+    spans: list[_Span] = []
+    offset = 0
+
+    def _add(text: str, style: str | None = None) -> None:
+        nonlocal offset
+        end = offset + len(text)
+        if style and end > offset:
+            spans.append(_Span(offset, end, style))
+        parts.append(text)
+        offset = end
+
+    def _add_blank_rows(count: int) -> None:
+        # Identical empty rows inside the inner frame, emitted as a single
+        # repeated string with just the border spans added per row.
+        nonlocal offset
+        if count <= 0:
+            return
+        fill_len = len(blank_fill)
+        row_len = fill_len + 5
+        end = offset + row_len * count
+        parts.append(("\u2502\u2502" + blank_fill + "\u2502\u2502\n") * count)
+        for start in range(offset, end, row_len):
+            spans.append(_Span(start, start + 2, "dim"))
+            spans.append(_Span(start + fill_len + 2, start + fill_len + 4, "dim"))
+        offset = end
 
     # -- flame zone budget --
     flame_rows = max(h - _FIXED_ROWS, _MIN_FLAME_ROWS)
@@ -756,98 +885,84 @@ def _build_fire_art(
     heat_row_count = _HEAT_ROWS if heat_on else 0
     flame_rows_effective = max(flame_rows - heat_row_count, _MIN_FLAME_ROWS)
 
-    num_defs = len(_FLAME_DEFS)
+    num_defs = len(_FLAME_ROWS)
     if flame_rows_effective >= num_defs:
         blank_above = flame_rows_effective - num_defs
-        defs_to_render = _FLAME_DEFS
+        first_row = 0
     else:
         blank_above = 0
-        defs_to_render = _FLAME_DEFS[num_defs - flame_rows_effective :]
+        first_row = num_defs - flame_rows_effective
 
     # -- heat indicator rows (above frame) --
-    if heat_on:
+    # On short widgets the minimum flame budget can leave no room for them.
+    actual_heat_rows = flame_rows - flame_rows_effective
+    if actual_heat_rows > 0:
         # Alternate two wave patterns for visual variety
-        wave_chars = [
+        wave_chars = (
             "\u2248" * ow,  # (approx-equal signs)
             "~" * ow,  # (tildes)
-        ]
-        actual_heat_rows = flame_rows - flame_rows_effective
+        )
         for i in range(actual_heat_rows):
-            result.append(" ")
-            result.append(
-                wave_chars[i % len(wave_chars)],
-                style="bright_red",
-            )
-            result.append(" ")
-            _nl()
+            _add(" ")
+            _add(wave_chars[i % len(wave_chars)], "bright_red")
+            _add(" \n")
 
     # -- top edge --
-    result.append("\u2581" * w, style="dim")
-    _nl()
+    _add("\u2581" * w, "dim")
+    _add("\n")
 
     # -- outer frame top --
-    result.append("\u250c" + "\u2500" * ow + "\u2510", style="dim")
-    _nl()
+    _add("\u250c" + outer_rule + "\u2510", "dim")
+    _add("\n")
 
     # -- inner frame top --
-    result.append("\u2502", style="dim")
-    result.append("\u250c" + "\u2500" * (ow - 2) + "\u2510", style="dim")
-    result.append("\u2502", style="dim")
-    _nl()
+    _add("\u2502\u250c" + inner_rule + "\u2510\u2502", "dim")
+    _add("\n")
 
     # -- LED strip --
-    result.append("\u2502\u2502", style="dim")
-    result.append("\u2591" * iw, style=led_style)
-    result.append("\u2502\u2502", style="dim")
-    _nl()
+    _add("\u2502\u2502", "dim")
+    _add("\u2591" * iw, led_style)
+    _add("\u2502\u2502", "dim")
+    _add("\n")
 
     # Blank rows above flames
-    for _ in range(blank_above):
-        result.append("\u2502\u2502", style="dim")
-        result.append(" " * iw)
-        result.append("\u2502\u2502", style="dim")
-        _nl()
-
-    # Flame rows (or blank if standby)
-    for body_frac, zone, atoms in defs_to_render:
-        result.append("\u2502\u2502", style="dim")
-        if fire_on:
-            min_w = sum(len(a[0]) for a in atoms) + len(atoms) - 1
-            body_w = max(int(iw * body_frac), min_w)
-            lead = (iw - body_w) // 2
-            style = palette[zone]
-            flame_line = _Text(" " * lead)
-            flame_line.append_text(_expand_flame(atoms, body_w, style))
-            result.append_text(flame_line)
-            result.append(" " * max(iw - lead - body_w, 0))
-        else:
-            result.append(" " * iw)
-        result.append("\u2502\u2502", style="dim")
-        _nl()
+    _add_blank_rows(blank_above)
+
+    # Flame rows (or blank if standby).  The flame pieces are written
+    # straight into the buffers: this is the per-frame hot loop.
+    if not fire_on:
+        _add_blank_rows(num_defs - first_row)
+    else:
+        for row in range(first_row, num_defs):
+            style = palette[_FLAME_ROWS[row][1]]
+            _add("\u2502\u2502", "dim")
+            for text, is_flame in _flame_row_layout(row, iw):
+                end = offset + len(text)
+                if is_flame:
+                    spans.append(_Span(offset, end, style))
+                parts.append(text)
+                offset = end
+            _add("\u2502\u2502", "dim")
+            _add("\n")
 
     # -- inner media bed --
-    result.append("\u2502\u2502", style="dim")
-    result.append("\u2593" * iw, style=media_style)
-    result.append("\u2502\u2502", style="dim")
-    _nl()
+    _add("\u2502\u2502", "dim")
+    _add("\u2593" * iw, media_style)
+    _add("\u2502\u2502", "dim")
+    _add("\n")
 
     # -- inner frame bottom --
-    result.append("\u2502", style="dim")
-    result.append("\u2514" + "\u2500" * (ow - 2) + "\u2518", style="dim")
-    result.append("\u2502", style="dim")
-    _nl()
+    _add("\u2502\u2514" + inner_rule + "\u2518\u2502", "dim")
+    _add("\n")
 
     # -- outer hearth (fixed dim) --
-    result.append("\u2502", style="dim")
-    result.append("\u2593" * ow, style="dim")
-    result.append("\u2502", style="dim")
-    _nl()
+    _add("\u2502" + "\u2593" * ow + "\u2502", "dim")
+    _add("\n")
 
     # -- outer frame bottom --
-    bottom = "\u2514" + "\u2500" * ow + "\u2518"
-    result.append(bottom, style="dim")  # no trailing newline
+    _add("\u2514" + outer_rule + "\u2518", "dim")  # no trailing newline
 
-    return result
+    return _Text("".join(parts), spans=spans)
 
 
 class FireplaceVisual(Static):
@@ -857,9 +972,37 @@ class FireplaceVisual(Static):
     _anim_timer: Timer | None = None
     _flame_speed: int = 3
     _heat_on: bool = False
+    _anim_paused: bool = False
+    _last_render_key: tuple[int, int, int] | None = None
+    _last_render_art: _Text | None = None
+    _state_key: tuple[ModeParam | None, FlameEffectParam | None, bool] | None = None
+    # Drawing inputs derived from the state in update_state(); the
+    # defaults are what is shown before any state arrives.
+    _fire_on: bool = True
+    _palette: tuple[str, str, str] = _DEFAULT_PALETTE
+    _led_style: str = "dim"
+    _media_style: str = "dim"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._art_cache: OrderedDict[tuple[object, ...], _Text] = OrderedDict()
+
+    def pause_animation(self) -> None:
+        """Stop advancing flame frames while the visual cannot be seen."""
+        self._anim_paused = True
+        if self._anim_timer is not None:
+            self._anim_timer.pause()
+
+    def resume_animation(self) -> None:
+        """Continue advancing flame frames after :meth:`pause_animation`."""
+        self._anim_paused = False
+        if self._anim_timer is not None:
+            self._anim_timer.resume()
 
     def _advance_frame(self) -> None:
         """Advance the animation frame and trigger a repaint."""
+        # Every palette has three distinct colours, so each rotation is a
+        # visible change; the timer only runs while the fire is lit.
         self._anim_frame = (self._anim_frame + 1) % 3
         self.refresh()
 
@@ -870,21 +1013,38 @@ class FireplaceVisual(Static):
         heat_param: HeatParam | None = None,
     ) -> None:
         """Update the visual with new fireplace state."""
-        self._mode = mode
-        self._flame_effect = flame_effect
+        heat_on = heat_param is not None and heat_param.heat_status == HeatStatus.ON
 
-        # Determine heat-on state
-        if heat_param is not None:
-            from flameconnect.models import HeatStatus
+        # Other parameters (timer, sound, ...) changing still lands here;
+        # when nothing the visual draws has changed, keep the current
+        # frame and timer rather than repainting.
+        state_key = (mode, flame_effect, heat_on)
+        if state_key == self._state_key:
+            return
+        self._state_key = state_key
 
-            self._heat_on = heat_param.heat_status == HeatStatus.ON
-        else:
-            self._heat_on = False
+        self._heat_on = heat_on
+        self._last_render_key = None
+
+        power_on = True
+        palette = _DEFAULT_PALETTE
+        led_style = "dim"
+        media_style = "dim"
 
-        # Determine fire-on state (power on AND flame effect on)
-        fire_on = True
         if mode is not None:
-            fire_on = mode.mode == FireMode.MANUAL
+            power_on = mode.mode == FireMode.MANUAL
+
+        # LED and media styling applies when power is on,
+        # regardless of flame effect state.
+        if power_on and flame_effect is not None:
+            palette = _FLAME_PALETTES.get(flame_effect.flame_color, _DEFAULT_PALETTE)
+            if flame_effect.light_status == LightStatus.ON:
+                led_style = _rgbw_to_style(flame_effect.overhead_color)
+            media_style = _rgbw_to_style(flame_effect.media_color)
+
+        # Flames are only visible when power is on AND
+        # flame effect is ON (or not yet received).
+        fire_on = power_on
         if (
             fire_on
             and flame_effect is not None
@@ -892,6 +1052,11 @@ class FireplaceVisual(Static):
         ):
             fire_on = False
 
+        self._fire_on = fire_on
+        self._palette = palette
+        self._led_style = led_style
+        self._media_style = media_style
+
         # Determine desired flame speed
         new_speed = 3
         if flame_effect is not None:
@@ -907,7 +1072,9 @@ class FireplaceVisual(Static):
                     self._anim_timer.stop()
                     self._anim_timer = None
                 interval = _FLAME_SPEED_INTERVALS.get(self._flame_speed, 0.3)
-                self._anim_timer = self.set_interval(interval, self._advance_frame)
+                self._anim_timer = self.set_interval(
+                    interval, self._advance_frame, pause=self._anim_paused
+                )
         else:
             # Fire is off -- stop animation
             if self._anim_timer is not None:
@@ -919,57 +1086,67 @@ class FireplaceVisual(Static):
 
     def render(self) -> _Text:
         """Render fireplace art scaled to the widget's content region."""
-        w = self.content_region.width
-        h = self.content_region.height
+        # One region lookup: each content_region access asks the compositor
+        # for the widget's region and re-applies the gutter.
+        w, h = self.content_size
         if w < 20:
             w = 48
         if h == 0:
             h = _DEFAULT_HEIGHT
 
-        mode = getattr(self, "_mode", None)
-        flame_effect = getattr(self, "_flame_effect", None)
-
-        power_on = True
-        palette = _DEFAULT_PALETTE
-        led_style = "dim"
-        media_style = "dim"
-
-        if mode is not None:
-            power_on = mode.mode == FireMode.MANUAL
+        # Between state updates only the geometry and the animation frame
+        # can change, so a repaint of the same frame skips the cache lookup.
+        last_key = (w, h, self._anim_frame)
+        if last_key == self._last_render_key and self._last_render_art is not None:
+            return self._last_render_art.copy()
 
-        # LED and media styling applies when power is on,
-        # regardless of flame effect state.
-        if power_on and flame_effect is not None:
-            palette = _FLAME_PALETTES.get(flame_effect.flame_color, _DEFAULT_PALETTE)
-            if flame_effect.light_status == LightStatus.ON:
-                led_style = _rgbw_to_style(flame_effect.overhead_color)
-            media_style = _rgbw_to_style(flame_effect.media_color)
+        fire_on = self._fire_on
+        palette = self._palette
+        led_style = self._led_style
+        media_style = self._media_style
 
-        # Flames are only visible when power is on AND
-        # flame effect is ON (or not yet received).
-        fire_on = power_on
-        if (
-            fire_on
-            and flame_effect is not None
-            and flame_effect.flame_effect != FlameEffect.ON
-        ):
-            fire_on = False
-
-        return _build_fire_art(
+        key = (
             w,
             h,
-            fire_on=fire_on,
-            flame_palette=palette,
-            led_style=led_style,
-            media_style=media_style,
-            anim_frame=self._anim_frame,
-            heat_on=self._heat_on,
+            fire_on,
+            palette,
+            led_style,
+            media_style,
+            self._anim_frame,
+            self._heat_on,
         )
+        cache = self._art_cache
+        art = cache.get(key)
+        if art is None:
+            art = _build_fire_art(
+                w,
+                h,
+                fire_on=fire_on,
+                flame_palette=palette,
+                led_style=led_style,
+                media_style=media_style,
+                anim_frame=self._anim_frame,
+                heat_on=self._heat_on,
+            )
+            cache[key] = art
+            if len(cache) > _ART_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        self._last_render_key = last_key
+        self._last_render_art = art
+        # Hand out a copy so the cached frame is never mutated downstream.
+        return art.copy()
 
 
 class ParameterPanel(Vertical):
     """Container widget displaying decoded parameters as clickable fields."""
 
+    _last_params: tuple[Parameter, ...] | None = None
+    _timer_shown: bool = False
+    _fields: list[tuple[str, str, str | None]] | None = None
+    _rows: list[ClickableParam] | None = None
+
     def compose(self) -> ComposeResult:
         """Initial composition -- a loading placeholder."""
         yield Static("[dim]Loading...[/dim]")
@@ -978,15 +1155,41 @@ class ParameterPanel(Vertical):
         """Update the panel with new parameter data.
 
         Clears existing children and mounts new
-        :class:`ClickableParam` widgets for each field.
+        :class:`ClickableParam` widgets for each field.  Does nothing when
+        *params* equal the last parameters shown, and only updates the
+        changed values in place when the fields (labels and actions) are
+        the same as those shown.  A timer row is always re-formatted, as
+        its "Off at" time moves with the clock.
 
         Args:
             params: Parameter dataclass instances.
         """
+        snapshot = tuple(params)
+        if snapshot == self._last_params and not self._timer_shown:
+            return
+        self._last_params = snapshot
+        self._timer_shown = any(type(param) is TimerParam for param in snapshot)
         fields = format_parameters(params)
+        shown = self._fields
+        rows = self._rows
+        self._fields = fields
+        if (
+            shown is not None
+            and rows is not None
+            and len(shown) == len(fields)
+            and all(
+                old[0] == new[0] and old[2] == new[2]
+                for old, new in zip(shown, fields, strict=True)
+            )
+        ):
+            for row, old, new in zip(rows, shown, fields, strict=True):
+                if old[1] != new[1]:
+                    row.set_value(new[1])
+            return
         widgets: list[ClickableParam] = []
         for label, value, action in fields:
             widgets.append(ClickableParam(label, value, action=action))
+        self._rows = widgets
         self.query("*").remove()
         self.mount(*widgets)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from flameconnect.models import FlameColor, RGBWColor
 from flameconnect.tui.widgets import (
+    _DEFAULT_PALETTE,
     _FIXED_ROWS,
     _FLAME_PALETTES,
     _MIN_FLAME_ROWS,
@@ -34,6 +35,13 @@ class TestRgbwToStyle:
         color = RGBWColor(red=250, green=250, blue=250, white=50)
         assert _rgbw_to_style(color) == "rgb(255,255,255)"
 
+    def test_rgbw_to_style_reuses_cached_string(self):
+        """Equal colors share one cached style string."""
+        first = _rgbw_to_style(RGBWColor(red=1, green=2, blue=3, white=4))
+        second = _rgbw_to_style(RGBWColor(red=1, green=2, blue=3, white=4))
+        assert first == "rgb(5,6,7)"
+        assert first is second
+
 
 # ---------------------------------------------------------------------------
 # _build_fire_art – structural characters
@@ -102,6 +110,20 @@ class TestFlameVisibility:
             # Inner content should be spaces only
             assert inner.strip() == "", f"Expected blank flame row, got: {inner!r}"
 
+    def test_blank_rows_keep_dim_borders(self):
+        """Each blank row's side borders are dim and its fill is unstyled."""
+        text = _build_fire_art(50, 40, fire_on=False)
+        offset = 0
+        blank_rows = 0
+        for line in text.plain.split("\n"):
+            if line == "\u2502\u2502" + " " * 46 + "\u2502\u2502":
+                blank_rows += 1
+                assert "dim" in _style_at(text, offset)
+                assert "dim" in _style_at(text, offset + 49)
+                assert _style_at(text, offset + 2) == ""
+            offset += len(line) + 1
+        assert blank_rows > 1
+
 
 # ---------------------------------------------------------------------------
 # _build_fire_art – style application
@@ -207,6 +229,12 @@ class TestHeightAdaptation:
         lines = text.plain.split("\n")
         assert len(lines) == 12
 
+    def test_heat_rows_dropped_when_no_room(self):
+        """At the minimum height heat-on draws no wave rows at all."""
+        text = _build_fire_art(50, 5, heat_on=True)
+        assert text.plain == _build_fire_art(50, 5).plain
+        assert "\u2248" not in text.plain
+
     def test_height_adaptation_minimum(self):
         """With h=5 (< fixed + min), at least 2 flame rows are present."""
         text = _build_fire_art(50, 5)
@@ -298,6 +326,13 @@ class TestFlamePalettesCompleteness:
                 f"Missing palette for FlameColor.{member.name}"
             )
 
+    def test_palettes_have_distinct_colors(self):
+        """Each animation tick rotates the palette, which only changes the
+        frame when the three colours differ; FireplaceVisual relies on this
+        and repaints on every tick without comparing frames."""
+        for color, palette in [*_FLAME_PALETTES.items(), (None, _DEFAULT_PALETTE)]:
+            assert len(set(palette)) == 3, color
+
 
 # ---------------------------------------------------------------------------
 # Helper
@@ -310,3 +345,162 @@ def _style_at(text, offset: int) -> str:
         if span.start <= offset < span.end:
             return str(span.style)
     return ""
+
+
+# ---------------------------------------------------------------------------
+# FireplaceVisual frame cache
+# ---------------------------------------------------------------------------
+
+
+class TestFrameCache:
+    """Tests for FireplaceVisual's rendered-frame cache."""
+
+    def test_repeat_render_reuses_built_frame(self):
+        from unittest.mock import patch
+
+        from flameconnect.tui import widgets
+        from flameconnect.tui.widgets import FireplaceVisual
+
+        visual = FireplaceVisual()
+        with patch.object(
+            widgets, "_build_fire_art", wraps=widgets._build_fire_art
+        ) as build:
+            first = visual.render()
+            second = visual.render()
+        build.assert_called_once()
+        assert first.plain == second.plain
+        assert first is not second
+
+    def test_cache_is_bounded(self):
+        from flameconnect.tui.widgets import _ART_CACHE_SIZE, FireplaceVisual
+
+        visual = FireplaceVisual()
+        for i in range(_ART_CACHE_SIZE):
+            visual._art_cache[("stale", i)] = _build_fire_art(40, 20)
+        visual.render()
+        assert len(visual._art_cache) == _ART_CACHE_SIZE
+        assert ("stale", 0) not in visual._art_cache
+
+    def test_unchanged_repaint_skips_cache_lookup(self):
+        from flameconnect.tui.widgets import FireplaceVisual
+
+        visual = FireplaceVisual()
+        first = visual.render()
+        visual._art_cache.clear()
+        second = visual.render()
+        assert second.plain == first.plain
+        assert second is not first
+        assert not visual._art_cache
+
+    def test_update_state_invalidates_last_render(self):
+        from flameconnect.models import FireMode, ModeParam
+        from flameconnect.tui.widgets import FireplaceVisual
+
+        visual = FireplaceVisual()
+        lit = visual.render()
+        visual.update_state(
+            ModeParam(mode=FireMode.STANDBY, target_temperature=20.0), None
+        )
+        assert visual._last_render_key is None
+        assert visual.render().plain != lit.plain
+
+    def test_render_does_not_rederive_styles(self):
+        from unittest.mock import patch
+
+        from flameconnect.models import (
+            Brightness,
+            FlameEffect,
+            FlameEffectParam,
+            LightStatus,
+            MediaTheme,
+            PulsatingEffect,
+        )
+        from flameconnect.tui import widgets
+        from flameconnect.tui.widgets import FireplaceVisual
+
+        visual = FireplaceVisual()
+        visual.update_state(
+            None,
+            FlameEffectParam(
+                flame_effect=FlameEffect.OFF,
+                flame_speed=3,
+                brightness=Brightness.HIGH,
+                pulsating_effect=PulsatingEffect.OFF,
+                media_theme=MediaTheme.USER_DEFINED,
+                media_light=LightStatus.ON,
+                media_color=RGBWColor(red=10, green=20, blue=30, white=0),
+                overhead_light=LightStatus.ON,
+                overhead_color=RGBWColor(red=40, green=50, blue=60, white=0),
+                light_status=LightStatus.ON,
+                flame_color=FlameColor.BLUE,
+                ambient_sensor=LightStatus.OFF,
+            ),
+        )
+        assert visual._fire_on is False
+        assert visual._palette == _FLAME_PALETTES[FlameColor.BLUE]
+        assert visual._led_style == "rgb(40,50,60)"
+        assert visual._media_style == "rgb(10,20,30)"
+        with patch.object(widgets, "_rgbw_to_style") as to_style:
+            text = visual.render()
+        to_style.assert_not_called()
+        media_at = text.plain.index("\u2593")
+        assert _style_at(text, media_at) == "rgb(10,20,30)"
+
+    def test_unchanged_state_keeps_last_render(self):
+        from unittest.mock import patch
+
+        from flameconnect.models import FireMode, ModeParam
+        from flameconnect.tui.widgets import FireplaceVisual
+
+        visual = FireplaceVisual()
+        standby = ModeParam(mode=FireMode.STANDBY, target_temperature=20.0)
+        visual.update_state(standby, None)
+        visual.render()
+        key = visual._last_render_key
+        with patch.object(visual, "refresh") as refresh:
+            visual.update_state(
+                ModeParam(mode=FireMode.STANDBY, target_temperature=20.0), None
+            )
+        refresh.assert_not_called()
+        assert visual._last_render_key == key
+
+
+# ---------------------------------------------------------------------------
+# Precomputed flame row geometry
+# ---------------------------------------------------------------------------
+
+
+class TestFlameRowGeometry:
+    """_FLAME_ROWS must agree with the raw _FLAME_DEFS it is built from."""
+
+    def test_geometry_matches_atoms(self):
+        from flameconnect.tui.widgets import _FLAME_DEFS, _FLAME_ROWS
+
+        assert len(_FLAME_ROWS) == len(_FLAME_DEFS)
+        for (frac, zone, atoms), row in zip(_FLAME_DEFS, _FLAME_ROWS, strict=True):
+            chars_w = sum(len(text) for text, _ in atoms)
+            assert row[:3] == (frac, zone, tuple(atoms))
+            assert row[3] == chars_w
+            assert row[4] == (sum(gap for _, gap in atoms) or 1)
+            assert row[5] == chars_w + len(atoms) - 1
+
+    def test_expand_flame_is_cached_per_width(self):
+        from flameconnect.tui.widgets import _FLAME_ROWS, _expand_flame
+
+        _, _, atoms, chars_w, _, _ = _FLAME_ROWS[0]
+        first = _expand_flame(0, 60)
+        assert _expand_flame(0, 60) is first
+        assert sum(len(t) for t, _ in first) == max(60, chars_w)
+        assert [t for t, is_flame in first if is_flame] == [t for t, _ in atoms]
+        wider = _expand_flame(0, 80)
+        assert sum(len(t) for t, _ in wider) == max(80, chars_w)
+
+    def test_row_layout_is_padded_to_inner_width(self):
+        from flameconnect.tui.widgets import _FLAME_ROWS, _flame_row_layout
+
+        for row in range(len(_FLAME_ROWS)):
+            layout = _flame_row_layout(row, 56)
+            assert _flame_row_layout(row, 56) is layout
+            assert sum(len(t) for t, _ in layout) == max(56, _FLAME_ROWS[row][5])
+            assert not layout[0][1]
+            assert not layout[-1][1]
@@ -1442,6 +1442,24 @@ class TestActionTogglePower:
         mock_client.turn_on.assert_not_awaited()
         mock_client.turn_off.assert_not_awaited()
 
+    async def test_double_press_issues_single_rpc(self, mock_client, mock_dashboard):
+        """A second press before the first write lands should be ignored."""
+        mock_dashboard.current_mode = ModeParam(
+            mode=FireMode.MANUAL, target_temperature=22.0
+        )
+        app = _make_app(mock_client, mock_dashboard)
+
+        with patch.object(type(app), "screen", new_callable=PropertyMock) as prop:
+            prop.return_value = mock_dashboard
+            app.action_toggle_power()
+            app.action_toggle_power()
+            await _run_workers(app)
+
+        mock_client.turn_off.assert_awaited_once_with("test-fire-001")
+        mock_client.turn_on.assert_not_awaited()
+        mock_dashboard.refresh_state.assert_awaited_once()
+        assert app._write_in_progress is False
+
     async def test_no_op_when_not_dashboard(self, mock_client):
         non_dashboard = MagicMock(spec=[])
         app = _make_app(mock_client, non_dashboard)
@@ -2525,13 +2543,38 @@ class TestPushDashboard:
         app = _make_app(mock_client, mock_dashboard)
         app.push_screen = MagicMock()
 
-        app._push_dashboard(_TEST_FIRE)
+        with patch.object(type(app), "screen", new_callable=PropertyMock) as prop:
+            prop.return_value = MagicMock()
+            app._push_dashboard(_TEST_FIRE)
 
         app.push_screen.assert_called_once()
         call_args = app.push_screen.call_args
         screen_arg = call_args[0][0]
         assert isinstance(screen_arg, DashboardScreen)
 
+    def test_skips_push_when_fire_already_displayed(self, mock_client, mock_dashboard):
+        app = _make_app(mock_client, mock_dashboard)
+        app.push_screen = MagicMock()
+        mock_dashboard.fire_id = _TEST_FIRE.fire_id
+
+        with patch.object(type(app), "screen", new_callable=PropertyMock) as prop:
+            prop.return_value = mock_dashboard
+            app._push_dashboard(_TEST_FIRE)
+
+        app.push_screen.assert_not_called()
+
+    def test_pushes_when_dashboard_shows_other_fire(self, mock_client, mock_dashboard):
+        app = _make_app(mock_client, mock_dashboard)
+        app.push_screen = MagicMock()
+        mock_dashboard.fire_id = _TEST_FIRE.fire_id
+
+        with patch.object(type(app), "screen", new_callable=PropertyMock) as prop:
+            prop.return_value = mock_dashboard
+            app._push_dashboard(_TEST_FIRE_2)
+
+        app.push_screen.assert_called_once()
+        assert app.push_screen.call_args[0][0].fire_id == _TEST_FIRE_2.fire_id
+
 
 # ---------------------------------------------------------------------------
 # action_switch_fire callback detail
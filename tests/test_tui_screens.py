@@ -17,6 +17,7 @@ from __future__ import annotations
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from textual.app import App
 from textual.widgets import Button, Input, RichLog, Static
 
@@ -39,6 +40,8 @@ from flameconnect.models import (
     PulsatingEffect,
     RGBWColor,
     TempUnit,
+    TimerParam,
+    TimerStatus,
 )
 
 # ---------------------------------------------------------------------------
@@ -320,6 +323,14 @@ class TestMediaThemeScreen:
             row2 = app.screen.query("#media-theme-row2 Button")
             assert len(row1) + len(row2) == 9
 
+    async def test_button_labels_show_key_hint(self):
+        app = MediaThemeApp(MediaTheme.WHITE)
+        async with app.run_test(size=(80, 20)):
+            btn = app.screen.query_one("#theme-kaleidoscope", Button)
+            assert "Kaleidoscope" in str(btn.label)
+            assert btn.parent is not None
+            assert btn.parent.id == "media-theme-row2"
+
     async def test_current_theme_button_is_primary(self):
         app = MediaThemeApp(MediaTheme.BLUE)
         async with app.run_test(size=(80, 20)):
@@ -362,6 +373,14 @@ class TestMediaThemeScreen:
             await pilot.pause()
             assert app.dismiss_result == "SENTINEL"
 
+    async def test_unknown_theme_id_ignored(self):
+        app = MediaThemeApp(MediaTheme.WHITE)
+        async with app.run_test(size=(80, 20)) as pilot:
+            event = Button.Pressed(Button("X", id="theme-nonexistent"))
+            app.screen.on_button_pressed(event)
+            await pilot.pause()
+            assert app.dismiss_result == "SENTINEL"
+
     async def test_button_none_id_ignored(self):
         app = MediaThemeApp(MediaTheme.WHITE)
         async with app.run_test(size=(80, 20)) as pilot:
@@ -401,12 +420,39 @@ class HeatModeApp(App[None]):
 class TestHeatModeScreen:
     """Tests for HeatModeScreen."""
 
+    async def test_unknown_button_ignored(self):
+        app = HeatModeApp()
+        async with app.run_test(size=(60, 25)) as pilot:
+            app.screen.on_button_pressed(Button.Pressed(Button("X", id="other")))
+            app.screen.on_button_pressed(Button.Pressed(Button("X", id=None)))
+            await pilot.pause()
+            assert app.dismiss_result == "SENTINEL"
+
+    async def test_reopening_does_not_reload_css(self):
+        from flameconnect.tui.heat_mode_screen import HeatModeScreen
+
+        app = HeatModeApp()
+        async with app.run_test(size=(60, 25)) as pilot:
+            sources = len(app.stylesheet.source)
+            app.screen.action_cancel()
+            await pilot.pause()
+            await app.push_screen(HeatModeScreen(HeatMode.ECO, 5))
+            await pilot.pause()
+            assert isinstance(app.screen, HeatModeScreen)
+            assert len(app.stylesheet.source) == sources
+
     async def test_compose_shows_title_with_current_mode(self):
         app = HeatModeApp(HeatMode.ECO)
         async with app.run_test(size=(60, 25)):
             title = app.screen.query_one("#heat-mode-title", Static)
             assert "Eco" in str(title._Static__content)
 
+    async def test_title_humanises_multi_word_mode(self):
+        app = HeatModeApp(HeatMode.FAN_ONLY)
+        async with app.run_test(size=(60, 25)):
+            title = app.screen.query_one("#heat-mode-title", Static)
+            assert "current: Fan Only" in str(title._Static__content)
+
     async def test_compose_creates_three_mode_buttons(self):
         app = HeatModeApp()
         async with app.run_test(size=(60, 25)):
@@ -482,6 +528,24 @@ class TestHeatModeScreen:
             # Should NOT have dismissed
             assert app.dismiss_result == "SENTINEL"
 
+    async def test_boost_submit_strips_whitespace(self):
+        app = HeatModeApp()
+        async with app.run_test(size=(60, 25)) as pilot:
+            app.screen._submit_boost(" 7 ")
+            await pilot.pause()
+            assert app.dismiss_result == (HeatMode.BOOST, 7)
+
+    async def test_boost_submit_signed_value_notifies(self):
+        app = HeatModeApp()
+        async with app.run_test(size=(60, 25)) as pilot:
+            with patch.object(app.screen, "notify") as notify:
+                app.screen._submit_boost("-5")
+            await pilot.pause()
+            assert app.dismiss_result == "SENTINEL"
+            notify.assert_called_once_with(
+                "Please enter a number between 1 and 20", severity="error"
+            )
+
     async def test_boost_submit_out_of_range_notifies(self):
         app = HeatModeApp()
         async with app.run_test(size=(60, 25)) as pilot:
@@ -651,6 +715,16 @@ class TestTemperatureScreen:
             await pilot.pause()
             assert app.dismiss_result == "SENTINEL"
 
+    async def test_set_nan_does_not_dismiss(self):
+        app = TemperatureApp(22.0, TempUnit.CELSIUS)
+        async with app.run_test(size=(60, 20)) as pilot:
+            inp = app.screen.query_one("#temp-input", Input)
+            inp.value = "nan"
+            btn = app.screen.query_one("#set-btn", Button)
+            btn.press()
+            await pilot.pause()
+            assert app.dismiss_result == "SENTINEL"
+
     async def test_set_out_of_range_celsius_does_not_dismiss(self):
         app = TemperatureApp(22.0, TempUnit.CELSIUS)
         async with app.run_test(size=(60, 20)) as pilot:
@@ -896,6 +970,20 @@ class TestColorScreen:
             await pilot.pause()
             assert app.dismiss_result == NAMED_COLORS["dark-green"]
 
+    async def test_light_preset_key_binding(self):
+        app = ColorScreenApp()
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.press("B")
+            await pilot.pause()
+            assert app.dismiss_result == NAMED_COLORS["light-blue"]
+
+    def test_bindings_cover_every_preset(self):
+        from flameconnect.tui.color_screen import ColorScreen
+
+        actions = {b[1] for b in ColorScreen.BINDINGS}
+        for name in NAMED_COLORS:
+            assert f"select_preset('{name}')" in actions
+
     async def test_action_cancel(self):
         app = ColorScreenApp()
         async with app.run_test(size=(100, 30)) as pilot:
@@ -1001,6 +1089,15 @@ class TestFireSelectScreen:
             btn = app.screen.query_one("#fire-1", Button)
             assert btn.variant == "default"
 
+    async def test_button_label_includes_index_brand_and_state(self):
+        app = FireSelectApp()
+        async with app.run_test(size=(80, 20)):
+            btn = app.screen.query_one("#fire-1", Button)
+            label = str(btn.label)
+            assert label.startswith("2. Second Fire")
+            assert "OtherBrand GM-200" in label
+            assert label.endswith("(Not Connected)")
+
     async def test_button_press_selects_different_fire(self):
         app = FireSelectApp()
         async with app.run_test(size=(80, 20)) as pilot:
@@ -1235,6 +1332,16 @@ class TestAuthScreen:
             btn = app.screen.query_one("#sign-in-btn", Button)
             assert btn.disabled is False
 
+    async def test_set_inputs_disabled_targets_url_input_after_fallback(self):
+        app = AuthScreenApp()
+        async with app.run_test(size=(80, 25)) as pilot:
+            with patch("webbrowser.open"):
+                app.screen._switch_to_browser_fallback("Bad credentials")
+                await pilot.pause()
+                app.screen._set_inputs_disabled(True)
+                assert app.screen.query_one("#url-input", Input).disabled is True
+                assert app.screen.query_one("#sign-in-btn", Button).disabled is True
+
     async def test_credential_submit_triggers_worker(self):
         """Submitting with credentials starts the login worker."""
         app = AuthScreenApp()
@@ -1253,11 +1360,12 @@ class TestAuthScreen:
         async with app.run_test(size=(80, 25)) as pilot:
             mock_login = AsyncMock(return_value="msal://redirect?code=123")
             with patch(
-                "flameconnect.b2c_login.b2c_login_with_credentials",
+                "flameconnect.tui.auth_screen.b2c_login_with_credentials",
                 mock_login,
             ):
                 await app.screen._do_credential_login("user@test.com", "pass")
                 await pilot.pause()
+                assert app.dismiss_result == "msal://redirect?code=123"
 
     async def test_switch_to_browser_fallback(self):
         """_switch_to_browser_fallback hides credential inputs and shows URL input."""
@@ -1277,6 +1385,43 @@ class TestAuthScreen:
                 url_input = app.screen.query_one("#url-input", Input)
                 assert url_input is not None
 
+    async def test_browser_fallback_opens_browser_in_thread_worker(self):
+        app = AuthScreenApp(auth_uri="https://example.com/auth?x=1")
+        async with app.run_test(size=(80, 25)) as pilot:
+            with patch("webbrowser.open") as mock_open:
+                with patch.object(
+                    app.screen, "run_worker", wraps=app.screen.run_worker
+                ) as mock_worker:
+                    app.screen._switch_to_browser_fallback("Bad credentials")
+                await app.screen.workers.wait_for_complete()
+                await pilot.pause()
+                assert mock_worker.call_args.kwargs["thread"] is True
+                mock_open.assert_called_once_with("https://example.com/auth?x=1")
+
+    async def test_browser_fallback_focuses_url_input(self):
+        """The URL input is focused on the next refresh, without a timer."""
+        app = AuthScreenApp()
+        async with app.run_test(size=(80, 25)) as pilot:
+            with patch("webbrowser.open"):
+                app.screen._switch_to_browser_fallback("Bad credentials")
+                await pilot.pause()
+                url_input = app.screen.query_one("#url-input", Input)
+                assert url_input.has_focus
+
+    async def test_browser_fallback_mounts_label_and_input_before_button(self):
+        app = AuthScreenApp()
+        async with app.run_test(size=(80, 25)) as pilot:
+            with patch("webbrowser.open"):
+                app.screen._switch_to_browser_fallback("Bad credentials")
+                await pilot.pause()
+                children = list(app.screen.query_one("#auth-dialog").children)
+                ids = [c.id for c in children]
+                label_idx = next(
+                    i for i, c in enumerate(children) if c.has_class("browser-label")
+                )
+                assert label_idx + 1 == ids.index("url-input")
+                assert ids.index("url-input") + 1 == ids.index("sign-in-btn")
+
     async def test_browser_fallback_submit_url(self):
         """In browser fallback mode, submitting a URL dismisses."""
         app = AuthScreenApp()
@@ -1371,6 +1516,23 @@ class TestDashboardScreen:
             visual = app.screen.query_one("#fireplace-visual")
             assert visual is not None
 
+    async def test_widget_references_set_before_mount(self):
+        from flameconnect.tui.screens import DashboardScreen
+
+        screen = DashboardScreen(MagicMock(), _TEST_FIRE)
+        # Available to handlers that run before the screen is mounted.
+        assert screen._param_panel.id == "param-panel"
+        assert screen._visual.id == "fireplace-visual"
+        assert screen._rich_log.id == "messages-panel"
+
+    async def test_widget_references_are_composed_widgets(self):
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)):
+            screen = app.screen
+            assert screen.query_one("#param-panel") is screen._param_panel
+            assert screen.query_one("#fireplace-visual") is screen._visual
+            assert screen.query_one("#messages-panel") is screen._rich_log
+
     async def test_sub_title_includes_fire_name(self):
         app = DashboardApp(fire=_TEST_FIRE)
         async with app.run_test(size=(120, 40)):
@@ -1503,6 +1665,150 @@ class TestDashboardScreen:
             await pilot.pause()
             assert "Updated:" in app.screen.sub_title
 
+    async def test_param_panel_skips_identical_parameters(self):
+        from flameconnect.tui import widgets
+
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            panel = app.screen._param_panel
+            params = [_DEFAULT_MODE, _DEFAULT_FLAME_EFFECT]
+            with patch.object(
+                widgets, "format_parameters", wraps=widgets.format_parameters
+            ) as fmt:
+                panel.update_parameters(params)
+                await pilot.pause()
+                panel.update_parameters(list(params))
+                await pilot.pause()
+            fmt.assert_called_once()
+
+    async def test_param_panel_refreshes_timer_for_identical_parameters(self):
+        from flameconnect.tui import widgets
+        from flameconnect.tui.widgets import _ClickableValue
+
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            panel = app.screen._param_panel
+            params = [_DEFAULT_MODE, TimerParam(TimerStatus.ENABLED, 30)]
+            with patch.object(widgets.time, "time", return_value=0.0):
+                panel.update_parameters(params)
+                await pilot.pause()
+            before = [str(v._Static__content) for v in panel.query(_ClickableValue)]
+            with patch.object(widgets.time, "time", return_value=3600.0):
+                panel.update_parameters(list(params))
+                await pilot.pause()
+            after = [str(v._Static__content) for v in panel.query(_ClickableValue)]
+            # The "Off at" time moved on with the clock.
+            assert before != after
+
+    async def test_param_panel_updates_changed_values_in_place(self):
+        from dataclasses import replace
+
+        from flameconnect.tui.widgets import ClickableParam, _ClickableValue
+
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            panel = app.screen._param_panel
+            panel.update_parameters([_DEFAULT_MODE, _DEFAULT_FLAME_EFFECT])
+            await pilot.pause()
+            rows = list(panel.query(ClickableParam))
+            faster = replace(_DEFAULT_FLAME_EFFECT, flame_speed=5)
+            panel.update_parameters([_DEFAULT_MODE, faster])
+            await pilot.pause()
+            assert list(panel.query(ClickableParam)) == rows
+            values = [str(v._Static__content) for v in panel.query(_ClickableValue)]
+            assert "5/5" in values
+            assert "3/5" not in values
+
+    async def test_param_panel_remounts_when_fields_change(self):
+        from flameconnect.tui.widgets import ClickableParam
+
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            panel = app.screen._param_panel
+            panel.update_parameters([_DEFAULT_MODE])
+            await pilot.pause()
+            rows = list(panel.query(ClickableParam))
+            panel.update_parameters([_DEFAULT_MODE, _DEFAULT_HEAT])
+            await pilot.pause()
+            new_rows = list(panel.query(ClickableParam))
+            assert len(new_rows) > len(rows)
+            assert not set(rows) & set(new_rows)
+
+    async def test_current_parameters_is_read_only_view(self):
+        overview = FireOverview(fire=_TEST_FIRE, parameters=[_DEFAULT_MODE])
+        client = MagicMock()
+        client.get_fire_overview = AsyncMock(return_value=overview)
+        app = DashboardApp(client=client, fire=_TEST_FIRE)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.screen.refresh_state()
+            await pilot.pause()
+            params = app.screen.current_parameters
+            assert params[ModeParam] == _DEFAULT_MODE
+            with pytest.raises(TypeError):
+                params[ModeParam] = _DEFAULT_MODE  # type: ignore[index]
+
+    async def test_update_display_sub_title_keeps_fire_details(self):
+        overview = FireOverview(fire=_TEST_FIRE, parameters=[_DEFAULT_MODE])
+        client = MagicMock()
+        client.get_fire_overview = AsyncMock(return_value=overview)
+        app = DashboardApp(client=client, fire=_TEST_FIRE)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.screen.refresh_state()
+            await pilot.pause()
+            assert app.screen.sub_title.startswith(
+                "Test Fire (test-fire-001) | TestBrand TM-100 | Updated: "
+            )
+
+    async def test_concurrent_refreshes_are_coalesced(self):
+        import asyncio
+
+        overview = FireOverview(fire=_TEST_FIRE, parameters=[_DEFAULT_MODE])
+        release = asyncio.Event()
+
+        async def _slow_overview(fire_id):
+            await release.wait()
+            return overview
+
+        client = MagicMock()
+        client.get_fire_overview = AsyncMock(return_value=overview)
+        app = DashboardApp(client=client, fire=_TEST_FIRE)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            client.get_fire_overview.reset_mock()
+            client.get_fire_overview.side_effect = _slow_overview
+            screen = app.screen
+            first = asyncio.create_task(screen.refresh_state())
+            await asyncio.sleep(0)
+            queued = [asyncio.create_task(screen.refresh_state()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, *queued)
+            # One in-flight fetch plus one shared follow-up for the waiters.
+            assert client.get_fire_overview.await_count == 2
+
+    async def test_update_display_skips_visual_when_unchanged(self):
+        overview = FireOverview(
+            fire=_TEST_FIRE,
+            parameters=[_DEFAULT_MODE, _DEFAULT_FLAME_EFFECT],
+        )
+        client = MagicMock()
+        client.get_fire_overview = AsyncMock(return_value=overview)
+        app = DashboardApp(client=client, fire=_TEST_FIRE)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.screen.refresh_state()
+            await pilot.pause()
+            screen = app.screen
+            with (
+                patch.object(screen._param_panel, "update_parameters") as update,
+                patch.object(screen._visual, "update_state") as visual_update,
+            ):
+                screen.sub_title = ""
+                await screen.refresh_state()
+            # The panel still sees the parameters, to keep the timer current.
+            update.assert_called_once_with(overview.parameters)
+            visual_update.assert_not_called()
+            assert "Updated:" in screen.sub_title
+
     async def test_on_unmount_removes_log_handler(self):
         app = DashboardApp()
         async with app.run_test(size=(120, 40)):
@@ -1528,6 +1834,39 @@ class TestDashboardScreen:
 class TestTuiLogHandler:
     """Tests for the _TuiLogHandler class."""
 
+    async def test_records_written_immediately_under_modal(self, caplog):
+        from flameconnect.tui.heat_mode_screen import HeatModeScreen
+
+        caplog.set_level(logging.INFO, logger="flameconnect")
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            dashboard = app.screen
+            await app.push_screen(HeatModeScreen(HeatMode.NORMAL, 5))
+            await pilot.pause()
+            # The messages panel stays visible behind the modal.
+            fc_logger = logging.getLogger("flameconnect.test")
+            with patch.object(dashboard._rich_log, "write") as write:
+                fc_logger.info("covered info")
+                fc_logger.warning("covered warning")
+            assert write.call_count == 2
+            assert "covered info" in write.call_args_list[0].args[0]
+            assert "covered warning" in write.call_args_list[1].args[0]
+
+    async def test_info_logged_under_modal_kept_after_dismissal(self, caplog):
+        from flameconnect.tui.heat_mode_screen import HeatModeScreen
+
+        caplog.set_level(logging.INFO, logger="flameconnect")
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            dashboard = app.screen
+            await app.push_screen(HeatModeScreen(HeatMode.NORMAL, 5))
+            await pilot.pause()
+            logging.getLogger("flameconnect.test").info("logged under modal")
+            app.pop_screen()
+            await pilot.pause()
+            shown = "".join(strip.text for strip in dashboard._rich_log.lines)
+            assert "logged under modal" in shown
+
     async def test_handler_writes_to_rich_log(self):
         app = DashboardApp()
         async with app.run_test(size=(120, 40)) as pilot:
@@ -1716,6 +2055,60 @@ class TestLogParamChanges:
             await app.screen.refresh_state()
             await pilot.pause()
 
+    async def test_logged_messages_use_pretty_labels(self):
+        old_mode = ModeParam(mode=FireMode.MANUAL, target_temperature=22.0)
+        new_mode = ModeParam(mode=FireMode.MANUAL, target_temperature=18.0)
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)):
+            screen = app.screen
+            with patch.object(screen, "_write_log_lines") as write_lines:
+                screen._log_param_changes({ModeParam: old_mode}, {ModeParam: new_mode})
+            write_lines.assert_called_once_with(
+                ["[bold]Mode[/bold] Target Temperature: 22.0 \u2192 18.0"]
+            )
+
+    async def test_multiple_changes_written_in_one_batch(self):
+        old_mode = ModeParam(mode=FireMode.MANUAL, target_temperature=22.0)
+        new_mode = ModeParam(mode=FireMode.STANDBY, target_temperature=18.0)
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)):
+            screen = app.screen
+            with patch.object(screen._rich_log, "write") as write:
+                screen._log_param_changes({ModeParam: old_mode}, {ModeParam: new_mode})
+            write.assert_called_once()
+            lines = write.call_args.args[0].split("\n")
+            assert len(lines) == 2
+            assert "[bold]Mode[/bold] Mode:" in lines[0]
+            assert "Target Temperature: 22.0" in lines[1]
+            assert all(line.startswith("[dim]") for line in lines)
+
+    async def test_no_messages_after_log_handler_removed(self):
+        old_mode = ModeParam(mode=FireMode.MANUAL, target_temperature=22.0)
+        new_mode = ModeParam(mode=FireMode.STANDBY, target_temperature=22.0)
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)):
+            screen = app.screen
+            screen.on_unmount()
+            with patch.object(screen, "_write_log_lines") as write_lines:
+                screen._log_param_changes({ModeParam: old_mode}, {ModeParam: new_mode})
+            write_lines.assert_not_called()
+
+    def test_fields_and_labels_cached_per_type(self):
+        from flameconnect.tui.screens import _fields_and_labels
+
+        labels = _fields_and_labels(ModeParam)
+        assert ("target_temperature", "Target Temperature") in labels
+        assert _fields_and_labels(ModeParam) is labels
+
+    def test_field_values_returns_tuples(self):
+        from flameconnect.models import TempUnitParam
+        from flameconnect.tui.screens import _field_values
+
+        mode = ModeParam(mode=FireMode.MANUAL, target_temperature=22.0)
+        assert _field_values(ModeParam)(mode) == (FireMode.MANUAL, 22.0)
+        unit = TempUnitParam(unit=TempUnit.CELSIUS)
+        assert _field_values(TempUnitParam)(unit) == (TempUnit.CELSIUS,)
+
 
 # ===================================================================
 # DashboardScreen compact mode
@@ -1725,6 +2118,39 @@ class TestLogParamChanges:
 class TestDashboardCompactMode:
     """Tests for compact mode toggling in DashboardScreen."""
 
+    async def test_compact_pauses_flame_animation(self):
+        app = DashboardApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            visual = app.screen._visual
+            assert visual._anim_paused is True
+            # A timer started while paused stays paused.
+            visual.update_state(_DEFAULT_MODE, _DEFAULT_FLAME_EFFECT)
+            assert visual._anim_timer is not None
+            assert not visual._anim_timer._active.is_set()
+
+    async def test_full_layout_runs_flame_animation(self):
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            assert app.screen._visual._anim_paused is False
+
+    async def test_flame_animation_runs_behind_modal(self):
+        from flameconnect.tui.heat_mode_screen import HeatModeScreen
+
+        app = DashboardApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            visual = app.screen._visual
+            await app.push_screen(HeatModeScreen(HeatMode.NORMAL, 5))
+            await pilot.pause()
+            # The dashboard still shows through the modal's translucent
+            # background, so the flames must not freeze.
+            assert visual._anim_paused is False
+            app.pop_screen()
+            await pilot.pause()
+            assert visual._anim_paused is False
+
     async def test_compact_at_small_size(self):
         app = DashboardApp()
         async with app.run_test(size=(80, 24)):
@@ -1800,6 +2226,41 @@ class TestLevelMarkup:
         assert "bold red" in open_tag
 
 
+class TestFormatLogLine:
+    """Tests for the shared messages-panel line format."""
+
+    def test_wraps_message_in_level_markup(self):
+        from flameconnect.tui.screens import _format_log_line
+
+        line = _format_log_line("12:00:00", logging.ERROR, "boom")
+        assert line == "[dim]12:00:00[/dim] [red]boom[/red]"
+
+    def test_unknown_level_has_no_markup(self):
+        from flameconnect.tui.screens import _format_log_line
+
+        assert _format_log_line("12:00:00", 5, "x") == "[dim]12:00:00[/dim] x"
+
+
+class TestClock:
+    """Tests for the cached HH:MM:SS formatter."""
+
+    def test_matches_strftime(self):
+        import time
+
+        from flameconnect.tui.screens import _clock
+
+        now = int(time.time())
+        assert _clock(now) == time.strftime("%H:%M:%S", time.localtime(now))
+
+    def test_reuses_result_within_same_second(self):
+        from flameconnect.tui.screens import _clock
+
+        _clock.cache_clear()
+        _clock(1_700_000_000)
+        _clock(1_700_000_000)
+        assert _clock.cache_info().hits == 1
+
+
 # ---------------------------------------------------------------------------
 # TimerScreen
 # ---------------------------------------------------------------------------
@@ -1863,6 +2324,16 @@ class TestTimerScreen:
             await pilot.pause()
             assert app.dismiss_result == "SENTINEL"
 
+    async def test_set_padded_number_dismisses(self):
+        app = TimerApp(60)
+        async with app.run_test(size=(60, 20)) as pilot:
+            inp = app.screen.query_one("#timer-input", Input)
+            inp.value = " 30 "
+            btn = app.screen.query_one("#set-btn", Button)
+            btn.press()
+            await pilot.pause()
+            assert app.dismiss_result == 30
+
     async def test_set_zero_does_not_dismiss(self):
         app = TimerApp(60)
         async with app.run_test(size=(60, 20)) as pilot:
@@ -53,6 +53,9 @@ from flameconnect.models import (
     TimerStatus,
 )
 from flameconnect.tui.widgets import (
+    _DISPLAY_ORDER,
+    _FORMATTERS,
+    _UNIT_FORMATTERS,
     _convert_temp,
     _display_name,
     _format_connection_state,
@@ -154,6 +157,41 @@ class TestDisplayName:
     def test_blue_red(self):
         assert _display_name(FlameColor.BLUE_RED) == "Blue Red"
 
+    def test_equal_valued_members_of_different_enums(self):
+        """Members that compare equal as ints keep their own names."""
+        assert FireMode.MANUAL == FlameEffect.ON
+        assert _display_name(FireMode.MANUAL) == "Manual"
+        assert _display_name(FlameEffect.ON) == "On"
+
+    def test_every_model_enum_is_precomputed(self):
+        """New enums in flameconnect.models must be added to the table."""
+        from enum import IntEnum
+
+        from flameconnect import models
+        from flameconnect.tui.widgets import _DISPLAY_NAMES
+
+        enums = [
+            obj
+            for obj in vars(models).values()
+            if isinstance(obj, type)
+            and issubclass(obj, IntEnum)
+            and obj.__module__ == models.__name__
+        ]
+        assert enums
+        for enum_type in enums:
+            for member in enum_type:
+                assert member.name in _DISPLAY_NAMES, (
+                    f"{enum_type.__name__}.{member.name}"
+                )
+
+    def test_enum_outside_table_falls_back(self):
+        from enum import IntEnum
+
+        class Other(IntEnum):
+            SOME_VALUE = 1
+
+        assert _display_name(Other.SOME_VALUE) == "Some Value"
+
 
 # ---------------------------------------------------------------------------
 # _format_rgbw
@@ -193,6 +231,10 @@ class TestTempSuffix:
     def test_fahrenheit(self):
         assert _temp_suffix(TempUnitParam(unit=TempUnit.FAHRENHEIT)) == "F"
 
+    def test_every_unit_has_a_suffix(self):
+        for unit in TempUnit:
+            assert _temp_suffix(TempUnitParam(unit=unit)) in ("C", "F")
+
 
 class TestConvertTemp:
     """Tests for _convert_temp helper."""
@@ -480,6 +522,17 @@ class TestFormatTimer:
         assert "Duration: 45min" in result[0][1]
         assert "Off at" not in result[0][1]
 
+    def test_off_time_is_local_clock_after_duration(self):
+        """The off-at time is the local wall clock *duration* minutes ahead."""
+        import time
+
+        now = 1_700_000_000.0
+        expected = time.strftime("%H:%M", time.localtime(now + 90 * 60))
+        param = TimerParam(timer_status=TimerStatus.ENABLED, duration=90)
+        with patch("flameconnect.tui.widgets.time.time", return_value=now):
+            result = _format_timer(param)
+        assert result[0][1].endswith(f"Off at {expected}")
+
 
 # ---------------------------------------------------------------------------
 # _format_software_version
@@ -919,6 +972,50 @@ class TestFormatParameters:
         assert "0xEF" in error_row[1]
         assert "0x01" in error_row[1]
 
+    def test_every_displayed_type_has_a_formatter(self):
+        """Each type in the display order is dispatched by exactly one table."""
+        for param_type in _DISPLAY_ORDER:
+            assert (param_type in _FORMATTERS) != (param_type in _UNIT_FORMATTERS)
+        assert set(_FORMATTERS) | set(_UNIT_FORMATTERS) == set(_DISPLAY_ORDER)
+
+    def test_repeat_calls_reuse_formatted_rows(self):
+        """Unchanged parameters are not re-formatted; results stay independent."""
+        from dataclasses import replace
+
+        from flameconnect.tui import widgets
+
+        widgets._param_rows.cache_clear()
+        param = _sample_flame_effect()
+        first = format_parameters([param])
+        first.clear()
+        formatter = MagicMock(side_effect=AssertionError("re-formatted"))
+        with patch.dict(widgets._FORMATTERS, {FlameEffectParam: formatter}):
+            second = format_parameters([param])
+        formatter.assert_not_called()
+        assert len(second) == 11
+
+        # A changed value is formatted afresh rather than served stale.
+        formatter = MagicMock(side_effect=widgets._format_flame_effect)
+        with patch.dict(widgets._FORMATTERS, {FlameEffectParam: formatter}):
+            format_parameters([replace(param, flame_speed=param.flame_speed % 5 + 1)])
+        formatter.assert_called_once()
+
+    def test_timer_is_formatted_on_every_call(self):
+        """The timer's off-at time depends on the clock, so it is not cached."""
+        param = TimerParam(timer_status=TimerStatus.ENABLED, duration=30)
+        with patch("flameconnect.tui.widgets.time.time", return_value=0.0):
+            early = format_parameters([param])
+        with patch("flameconnect.tui.widgets.time.time", return_value=3600.0):
+            later = format_parameters([param])
+        assert early != later
+
+    def test_unknown_param_type_is_ignored(self):
+        """Objects without a registered formatter produce no rows."""
+        temp_unit = TempUnitParam(unit=TempUnit.CELSIUS)
+        assert format_parameters([object(), temp_unit]) == format_parameters(  # type: ignore[list-item]
+            [temp_unit]
+        )
+
 
 # ---------------------------------------------------------------------------
 # ArrowNavMixin